@@ -11,20 +11,18 @@ Usage:
 
 import streamlit as st
 import json
+import math
 import os
 import sys
-import time
+from bisect import bisect_right
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models.project import HackathonProject, ProjectScore
-from models.scoring_engine import ScoringEngine
-from models.feedback_generator import FeedbackGenerator
 from utils.validators import validate_project_data, get_field_help_text, get_field_placeholder
 from utils.leaderboard import Leaderboard
-from utils.nlp_analyzer import NLPAnalyzer
 from config.settings import SCORING_CRITERIA, UI_CONFIG
 
 
@@ -44,12 +42,20 @@ st.set_page_config(
 # Load Custom CSS
 # =============================================================================
 
-def load_css():
-    """Load custom CSS styles."""
+@st.cache_resource
+def _css_text() -> str:
+    """Read the custom stylesheet once per server process."""
     css_path = Path(__file__).parent / "assets" / "styles.css"
     if css_path.exists():
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        return css_path.read_text()
+    return ""
+
+
+def load_css():
+    """Load custom CSS styles."""
+    css = _css_text()
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 
 # =============================================================================
@@ -59,7 +65,7 @@ def load_css():
 def init_session_state():
     """Initialize session state variables."""
     if "leaderboard" not in st.session_state:
-        storage_path = Path(__file__).parent / "data" / "leaderboard.json"
+        storage_path = Path(__file__).parent / "data" / "leaderboard.jsonl"
         st.session_state.leaderboard = Leaderboard(str(storage_path))
     
     if "current_score" not in st.session_state:
@@ -75,12 +81,69 @@ def init_session_state():
         st.session_state.show_sample = False
 
 
+# =============================================================================
+# Cached Resources
+# =============================================================================
+
+# The engine modules are imported here rather than at the top of the file so
+# that pages which never evaluate a project don't pay for loading them.
+
+@st.cache_resource
+def get_scoring_engine():
+    """Get the shared scoring engine (built once per server process)."""
+    from models.scoring_engine import ScoringEngine
+    return ScoringEngine()
+
+
+@st.cache_resource
+def get_feedback_generator():
+    """Get the shared feedback generator (built once per server process)."""
+    from models.feedback_generator import FeedbackGenerator
+    return FeedbackGenerator()
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def evaluate_project_cached(project_json: str) -> ProjectScore:
+    """
+    Score a project and generate its feedback, memoized on the submission.
+    
+    Args:
+        project_json: Cleaned form data serialized with sorted keys
+        
+    Returns:
+        ProjectScore: Complete evaluation with feedback
+    """
+    project = HackathonProject(**json.loads(project_json))
+    score = get_scoring_engine().evaluate_project(project)
+    return get_feedback_generator().generate_feedback(project, score)
+
+
 # =============================================================================
 # UI Components
 # =============================================================================
 
+def toggle_dark_mode():
+    """Flip the theme; runs as a callback before the header fragment reruns."""
+    st.session_state.dark_mode = not st.session_state.dark_mode
+
+
+@st.fragment
 def render_header():
-    """Render the application header."""
+    """
+    Render the application header and theme styles.
+    
+    Running as a fragment means the theme button only reruns the header,
+    not the whole page.
+    """
+    # Apply theme
+    if st.session_state.dark_mode:
+        st.markdown("""
+        <style>
+            .stApp { background-color: #0f172a; color: #f8fafc; }
+            .stMarkdown { color: #f8fafc; }
+        </style>
+        """, unsafe_allow_html=True)
+    
     col1, col2 = st.columns([5, 1])
     
     with col1:
@@ -97,9 +160,7 @@ def render_header():
     
     with col2:
         theme_icon = "🌙" if not st.session_state.dark_mode else "☀️"
-        if st.button(f"{theme_icon} Theme", key="theme_toggle"):
-            st.session_state.dark_mode = not st.session_state.dark_mode
-            st.rerun()
+        st.button(f"{theme_icon} Theme", key="theme_toggle", on_click=toggle_dark_mode)
 
 
 def render_sidebar():
@@ -113,6 +174,12 @@ def render_sidebar():
             label_visibility="collapsed"
         )
         
+        st.toggle(
+            "Advanced entry",
+            key="advanced_entry",
+            help="Submit the project as a single JSON object"
+        )
+        
         st.markdown("---")
         
         st.markdown("### ⚖️ Scoring Criteria")
@@ -130,19 +197,53 @@ def render_sidebar():
         st.markdown("---")
         
         st.markdown("### 📈 Stats")
+        # Filled in by render_sidebar_stats once the page has run, so a
+        # submission made in this run is already counted
+        stats_container = st.container()
+        
+        return page, stats_container
+
+
+def render_sidebar_stats(container):
+    """Render leaderboard statistics into the sidebar stats container."""
+    with container:
         stats = st.session_state.leaderboard.get_statistics()
         st.metric("Total Projects", stats["total_projects"])
         if stats["total_projects"] > 0:
             st.metric("Average Score", f"{stats['average_score']:.1f}")
-        
-        return page
+
+
+# Field order and defaults for the JSON entry mode
+_JSON_TEMPLATE = {
+    "project_title": "",
+    "team_size": 3,
+    "problem_statement": "",
+    "solution_description": "",
+    "tech_stack": "",
+    "innovation_description": "",
+    "github_link": "",
+    "demo_link": "",
+    "target_users": "",
+    "future_scope": ""
+}
 
 
 def render_input_form():
     """Render the project submission form."""
     st.markdown("### 📝 Submit Your Project")
     
-    with st.form("project_form"):
+    if st.session_state.get("advanced_entry"):
+        form_data = render_json_form()
+    else:
+        form_data = render_widget_form()
+    
+    if form_data is not None:
+        process_submission(form_data)
+
+
+def render_widget_form():
+    """Render the field-by-field form; return its data when submitted."""
+    with st.form("project_form", clear_on_submit=False, border=False):
         col1, col2 = st.columns([3, 1])
         
         with col1:
@@ -239,53 +340,128 @@ def render_input_form():
                 st.session_state.current_score = None
                 st.session_state.current_project = None
     
-    if submitted:
-        # Validate and process submission
-        form_data = {
-            "project_title": project_title,
-            "team_size": team_size,
-            "problem_statement": problem_statement,
-            "solution_description": solution_description,
-            "tech_stack": tech_stack,
-            "innovation_description": innovation_description,
-            "github_link": github_link,
-            "demo_link": demo_link,
-            "target_users": target_users,
-            "future_scope": future_scope
-        }
-        
-        is_valid, errors, cleaned_data = validate_project_data(form_data)
-        
-        if not is_valid:
-            for error in errors:
-                st.error(f"❌ {error}")
-        else:
-            with st.spinner("🔍 Analyzing project..."):
-                try:
-                    # Create project and evaluate
-                    project = HackathonProject(**cleaned_data)
-                    
-                    # Score the project
-                    scoring_engine = ScoringEngine()
-                    score = scoring_engine.evaluate_project(project)
-                    
-                    # Generate feedback
-                    feedback_gen = FeedbackGenerator()
-                    score = feedback_gen.generate_feedback(project, score)
-                    
-                    # Add to leaderboard
-                    rank = st.session_state.leaderboard.add_project(score)
-                    
-                    # Store in session
-                    st.session_state.current_score = score
-                    st.session_state.current_project = project
-                    
-                    st.success(f"✅ Project evaluated! Ranked #{rank} on the leaderboard.")
-                    time.sleep(0.5)
-                    st.rerun()
-                    
-                except Exception as e:
-                    st.error(f"❌ Error evaluating project: {str(e)}")
+    if not submitted:
+        return None
+    
+    return {
+        "project_title": project_title,
+        "team_size": team_size,
+        "problem_statement": problem_statement,
+        "solution_description": solution_description,
+        "tech_stack": tech_stack,
+        "innovation_description": innovation_description,
+        "github_link": github_link,
+        "demo_link": demo_link,
+        "target_users": target_users,
+        "future_scope": future_scope
+    }
+
+
+def render_json_form():
+    """Render the single-field JSON entry form; return its data when submitted."""
+    with st.form("project_json_form", clear_on_submit=False, border=False):
+        raw = st.text_area(
+            "Project JSON *",
+            value=json.dumps(_JSON_TEMPLATE, indent=2),
+            help="Paste the whole submission as one JSON object",
+            height=400
+        )
+        submitted = st.form_submit_button(
+            "🚀 Evaluate Project",
+            type="primary",
+            use_container_width=True
+        )
+    
+    if not submitted:
+        return None
+    
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        st.error(f"❌ Invalid JSON: {e}")
+        return None
+    
+    if not isinstance(data, dict):
+        st.error("❌ Project JSON must be an object")
+        return None
+    
+    # Only the known fields are passed on, missing ones fall back to defaults
+    return {field: data.get(field, default) for field, default in _JSON_TEMPLATE.items()}
+
+
+def process_submission(form_data: dict):
+    """Validate, score and record a submitted project."""
+    is_valid, errors, cleaned_data = validate_project_data(form_data)
+    
+    if not is_valid:
+        for error in errors:
+            st.error(f"❌ {error}")
+    else:
+        with st.spinner("🔍 Analyzing project..."):
+            try:
+                # Create project and evaluate
+                project = HackathonProject(**cleaned_data)
+                
+                # Score the project and generate feedback; identical
+                # resubmissions are served from the cache
+                score = evaluate_project_cached(json.dumps(cleaned_data, sort_keys=True))
+                
+                # Add to leaderboard
+                rank = st.session_state.leaderboard.add_project(score)
+                
+                # Store in session
+                st.session_state.current_score = score
+                st.session_state.current_project = project
+                
+                # Results are rendered below by main() in this same run
+                st.success(f"✅ Project evaluated! Ranked #{rank} on the leaderboard.")
+                
+            except Exception as e:
+                st.error(f"❌ Error evaluating project: {str(e)}")
+
+
+@st.cache_data(show_spinner=False)
+def _score_donut_svg(score: int, color: str) -> str:
+    """Build the score ring as one inline SVG (cached per score and color)."""
+    circumference = 2 * math.pi * 82.5
+    arc = circumference * score / 100
+    return f"""
+    <div style="text-align: center; padding: 24px;">
+        <svg width="180" height="180" viewBox="0 0 180 180" role="img" aria-label="Score {score} out of 100"
+             style="filter: drop-shadow(0 10px 25px rgba(0,0,0,0.1));">
+            <circle cx="90" cy="90" r="82.5" fill="white" stroke="#e2e8f0" stroke-width="15"/>
+            <circle cx="90" cy="90" r="82.5" fill="none" stroke="{color}" stroke-width="15"
+                    stroke-dasharray="{arc:.2f} {circumference:.2f}" transform="rotate(-90 90 90)"/>
+            <text x="90" y="92" text-anchor="middle" font-size="48" font-weight="800" fill="{color}">{score}</text>
+            <text x="90" y="122" text-anchor="middle" font-size="14" fill="#64748b">out of 100</text>
+        </svg>
+    </div>
+    """.strip()
+
+
+def _category_table_html(criteria_data: list) -> str:
+    """Build the category breakdown as a single HTML table with inline score bars."""
+    rows = []
+    for name, criterion_score, explanation, weight in criteria_data:
+        score_color = get_score_color(criterion_score)
+        rows.append(
+            f'<tr>'
+            f'<td style="padding: 8px 12px 8px 0; border: none; width: 100%;">'
+            f'<div><strong>{name}</strong> ({weight}%)</div>'
+            f'<div style="background: #e2e8f0; border-radius: 4px; height: 8px; margin: 6px 0;">'
+            f'<div style="width: {criterion_score:.0f}%; height: 100%; border-radius: 4px; background: {score_color};"></div>'
+            f'</div>'
+            f'<div style="color: #64748b; font-size: 0.85rem;">{explanation if explanation else "No specific feedback"}</div>'
+            f'</td>'
+            f'<td style="padding: 8px 0; border: none; text-align: center; font-size: 1.5rem; '
+            f'font-weight: 700; color: {score_color}; min-width: 80px;">{criterion_score:.0f}</td>'
+            f'</tr>'
+        )
+    return (
+        '<table style="width: 100%; border-collapse: collapse; border: none;">'
+        + "".join(rows)
+        + '</table>'
+    )
 
 
 def render_score_display(score: ProjectScore):
@@ -300,43 +476,13 @@ def render_score_display(score: ProjectScore):
         # Score circle
         score_color = get_score_color(score.final_score)
         
-        st.markdown(f"""
-        <div style="text-align: center; padding: 24px;">
-            <div style="
-                width: 180px;
-                height: 180px;
-                margin: 0 auto;
-                border-radius: 50%;
-                background: conic-gradient(
-                    {score_color} {score.final_score * 3.6}deg,
-                    #e2e8f0 {score.final_score * 3.6}deg
-                );
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                box-shadow: 0 10px 25px rgba(0,0,0,0.1);
-            ">
-                <div style="
-                    width: 150px;
-                    height: 150px;
-                    border-radius: 50%;
-                    background: white;
-                    display: flex;
-                    flex-direction: column;
-                    align-items: center;
-                    justify-content: center;
-                ">
-                    <span style="font-size: 3rem; font-weight: 800; color: {score_color};">
-                        {score.final_score:.0f}
-                    </span>
-                    <span style="font-size: 0.9rem; color: #64748b;">out of 100</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _score_donut_svg(round(score.final_score), score_color),
+            unsafe_allow_html=True
+        )
         
         # Verdict badge
-        verdict_class = get_verdict_class(score.verdict)
+        verdict_class = get_verdict_class(score)
         st.markdown(f"""
         <div style="text-align: center; margin-top: 16px;">
             <span class="verdict-badge {verdict_class}">
@@ -358,25 +504,8 @@ def render_score_display(score: ProjectScore):
         ("🌍 Real-World Impact", score.real_world_impact_score, score.real_world_impact_explanation, SCORING_CRITERIA["real_world_impact"]["weight"])
     ]
     
-    for name, criterion_score, explanation, weight in criteria_data:
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown(f"**{name}** ({weight}%)")
-            st.progress(criterion_score / 100)
-            st.caption(explanation if explanation else "No specific feedback")
-        
-        with col2:
-            score_color = get_score_color(criterion_score)
-            st.markdown(f"""
-            <div style="
-                text-align: center;
-                font-size: 1.5rem;
-                font-weight: 700;
-                color: {score_color};
-                padding-top: 8px;
-            ">{criterion_score:.0f}</div>
-            """, unsafe_allow_html=True)
+    # One table instead of a columns/progress/caption group per criterion
+    st.markdown(_category_table_html(criteria_data), unsafe_allow_html=True)
     
     # Penalties section
     if score.total_penalty > 0:
@@ -448,6 +577,54 @@ def render_feedback(score: ProjectScore):
     st.markdown(f"> {score.verdict_explanation}")
 
 
+def _row_html(ranking: dict) -> str:
+    """Build the HTML block for one leaderboard row."""
+    rank = ranking["rank"]
+    
+    # Determine styling
+    if rank == 1:
+        medal = "🥇"
+        bg_color = "rgba(251, 191, 36, 0.1)"
+        border_color = "#fbbf24"
+    elif rank == 2:
+        medal = "🥈"
+        bg_color = "rgba(156, 163, 175, 0.1)"
+        border_color = "#9ca3af"
+    elif rank == 3:
+        medal = "🥉"
+        bg_color = "rgba(180, 83, 9, 0.1)"
+        border_color = "#b45309"
+    else:
+        medal = f"#{rank}"
+        bg_color = "transparent"
+        border_color = "#e2e8f0"
+    
+    score_color = get_score_color(ranking["final_score"])
+    
+    return f"""
+    <div style="
+        display: flex;
+        align-items: center;
+        padding: 16px;
+        background: {bg_color};
+        border: 1px solid {border_color};
+        border-radius: 12px;
+        margin-bottom: 8px;
+    ">
+        <div style="font-size: 1.5rem; width: 50px; text-align: center;">{medal}</div>
+        <div style="flex: 1; margin-left: 12px;">
+            <div style="font-weight: 600; font-size: 1.1rem;">{ranking["project_title"]}</div>
+            <div style="color: #64748b; font-size: 0.9rem;">{ranking["verdict_emoji"]} {ranking["verdict"]}</div>
+        </div>
+        <div style="
+            font-size: 1.5rem;
+            font-weight: 700;
+            color: {score_color};
+        ">{ranking["final_score"]:.0f}</div>
+    </div>
+    """.strip()
+
+
 def render_leaderboard():
     """Render the leaderboard page."""
     st.markdown("## 📊 Leaderboard")
@@ -483,59 +660,19 @@ def render_leaderboard():
         st.markdown(winner_explanation)
         st.markdown("")
     
-    # Leaderboard table
-    for ranking in rankings:
-        rank = ranking["rank"]
-        
-        # Determine styling
-        if rank == 1:
-            medal = "🥇"
-            bg_color = "rgba(251, 191, 36, 0.1)"
-            border_color = "#fbbf24"
-        elif rank == 2:
-            medal = "🥈"
-            bg_color = "rgba(156, 163, 175, 0.1)"
-            border_color = "#9ca3af"
-        elif rank == 3:
-            medal = "🥉"
-            bg_color = "rgba(180, 83, 9, 0.1)"
-            border_color = "#b45309"
-        else:
-            medal = f"#{rank}"
-            bg_color = "transparent"
-            border_color = "#e2e8f0"
-        
-        score_color = get_score_color(ranking["final_score"])
-        
-        st.markdown(f"""
-        <div style="
-            display: flex;
-            align-items: center;
-            padding: 16px;
-            background: {bg_color};
-            border: 1px solid {border_color};
-            border-radius: 12px;
-            margin-bottom: 8px;
-        ">
-            <div style="font-size: 1.5rem; width: 50px; text-align: center;">{medal}</div>
-            <div style="flex: 1; margin-left: 12px;">
-                <div style="font-weight: 600; font-size: 1.1rem;">{ranking["project_title"]}</div>
-                <div style="color: #64748b; font-size: 0.9rem;">{ranking["verdict_emoji"]} {ranking["verdict"]}</div>
-            </div>
-            <div style="
-                font-size: 1.5rem;
-                font-weight: 700;
-                color: {score_color};
-            ">{ranking["final_score"]:.0f}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Leaderboard table, sent to the frontend as a single markdown element
+    rows_html = "\n".join(_row_html(ranking) for ranking in rankings)
+    st.markdown(f'<div class="leaderboard">\n{rows_html}\n</div>', unsafe_allow_html=True)
     
     # Clear leaderboard option
     st.markdown("---")
-    if st.button("🗑️ Clear Leaderboard", type="secondary"):
-        st.session_state.leaderboard.clear()
-        st.success("Leaderboard cleared!")
-        st.rerun()
+    st.button("🗑️ Clear Leaderboard", type="secondary", on_click=clear_leaderboard)
+
+
+def clear_leaderboard():
+    """Clear the board; runs as a callback so the page renders it empty in the same run."""
+    st.session_state.leaderboard.clear()
+    st.toast("Leaderboard cleared!", icon="✅")
 
 
 def render_about():
@@ -597,32 +734,29 @@ def render_about():
 # Helper Functions
 # =============================================================================
 
+# Lower bounds of the orange, light green and green score bands
+_SCORE_COLOR_THRESHOLDS = (50, 70, 85)
+_SCORE_COLORS = ("#ef4444", "#f59e0b", "#22c55e", "#10b981")  # Red .. green
+
+# CSS class for each verdict, indexed by ProjectScore.verdict_id
+_VERDICT_CLASSES = ("verdict-winner", "verdict-strong", "verdict-average", "verdict-not-ready")
+
+
 def get_score_color(score: float) -> str:
     """Get color based on score value."""
-    if score >= 85:
-        return "#10b981"  # Green
-    elif score >= 70:
-        return "#22c55e"  # Light green
-    elif score >= 50:
-        return "#f59e0b"  # Orange
-    else:
-        return "#ef4444"  # Red
+    return _SCORE_COLORS[bisect_right(_SCORE_COLOR_THRESHOLDS, score)]
 
 
-def get_verdict_class(verdict: str) -> str:
+def get_verdict_class(score: ProjectScore) -> str:
     """Get CSS class based on verdict."""
-    if "Winner" in verdict:
-        return "verdict-winner"
-    elif "Strong" in verdict:
-        return "verdict-strong"
-    elif "Average" in verdict:
-        return "verdict-average"
-    else:
+    if score.verdict_id is None:
         return "verdict-not-ready"
+    return _VERDICT_CLASSES[score.verdict_id]
 
 
+@st.cache_data(show_spinner=False)
 def load_sample_projects():
-    """Load sample projects from JSON file."""
+    """Load sample projects from JSON file (read once, copied per call)."""
     sample_path = Path(__file__).parent / "data" / "sample_projects.json"
     if sample_path.exists():
         with open(sample_path) as f:
@@ -640,20 +774,11 @@ def main():
     load_css()
     init_session_state()
     
-    # Apply theme
-    if st.session_state.dark_mode:
-        st.markdown("""
-        <style>
-            .stApp { background-color: #0f172a; color: #f8fafc; }
-            .stMarkdown { color: #f8fafc; }
-        </style>
-        """, unsafe_allow_html=True)
-    
-    # Render header
+    # Render header (includes the theme styles)
     render_header()
     
     # Render sidebar and get current page
-    page = render_sidebar()
+    page, stats_container = render_sidebar()
     
     # Render main content based on page
     if "Submit" in page:
@@ -670,6 +795,8 @@ def main():
     elif "About" in page:
         render_about()
     
+    render_sidebar_stats(stats_container)
+    
     # Footer
     st.markdown("---")
     st.markdown("""
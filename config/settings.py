@@ -5,7 +5,13 @@ This module contains all configurable parameters for the judging system,
 including scoring criteria weights, penalty thresholds, and keyword lists.
 """
 
-from typing import Dict, List, Tuple
+import sys
+from typing import Dict, Iterable, Tuple
+
+
+def _phrase_tuple(phrases: Iterable[str]) -> Tuple[str, ...]:
+    """Lowercase and intern phrases once, since they're matched against lowercased text."""
+    return tuple(sys.intern(phrase.lower()) for phrase in phrases)
 
 
 # =============================================================================
@@ -57,17 +63,23 @@ SCORING_CRITERIA: Dict[str, Dict] = {
     }
 }
 
+# Criterion keys in the order the engine scores them and feedback lists them
+CRITERIA_ORDER: Tuple[str, ...] = (
+    "innovation", "technical_depth", "problem_relevance", "feasibility",
+    "scalability", "ui_ux", "real_world_impact"
+)
+
 
 # =============================================================================
 # VERDICT THRESHOLDS
 # =============================================================================
 
-VERDICT_THRESHOLDS: Dict[str, Tuple[int, int, str, str]] = {
-    # (min_score, max_score, verdict, emoji)
-    "winner": (85, 100, "Winner Material", "🏆"),
-    "strong": (70, 84, "Strong Contender", "✅"),
-    "average": (50, 69, "Average", "⚠️"),
-    "not_ready": (0, 49, "Not Hackathon Ready", "❌")
+VERDICT_THRESHOLDS: Dict[str, Tuple[int, int, str, str, int]] = {
+    # (min_score, max_score, verdict, emoji, verdict_id)
+    "winner": (85, 100, "Winner Material", "🏆", 0),
+    "strong": (70, 84, "Strong Contender", "✅", 1),
+    "average": (50, 69, "Average", "⚠️", 2),
+    "not_ready": (0, 49, "Not Hackathon Ready", "❌", 3)
 }
 
 
@@ -75,7 +87,7 @@ VERDICT_THRESHOLDS: Dict[str, Tuple[int, int, str, str]] = {
 # BUZZWORD DETECTION
 # =============================================================================
 
-BUZZWORDS: List[str] = [
+BUZZWORDS: Tuple[str, ...] = _phrase_tuple([
     "revolutionary", "disruptive", "game-changing", "world-changing",
     "cutting-edge", "state-of-the-art", "next-generation", "groundbreaking",
     "paradigm shift", "synergy", "leverage", "ecosystem", "holistic",
@@ -84,7 +96,7 @@ BUZZWORDS: List[str] = [
     "breakthrough", "pioneering", "trailblazing", "bleeding-edge",
     "AI-powered", "blockchain-enabled", "cloud-native", "future-proof",
     "mission-critical", "enterprise-grade", "industry-leading"
-]
+])
 
 # Maximum allowed buzzword density (buzzwords per 100 words)
 MAX_BUZZWORD_DENSITY = 5.0
@@ -97,7 +109,7 @@ BUZZWORD_PENALTY = 2.0
 # VAGUENESS DETECTION
 # =============================================================================
 
-VAGUE_PHRASES: List[str] = [
+VAGUE_PHRASES: Tuple[str, ...] = _phrase_tuple([
     "and more", "etc.", "various", "multiple", "several", "many",
     "some kind of", "sort of", "kind of", "basically", "essentially",
     "generally", "typically", "usually", "often", "sometimes",
@@ -106,7 +118,7 @@ VAGUE_PHRASES: List[str] = [
     "when appropriate", "if necessary", "as applicable",
     "and so on", "and stuff", "things like", "or something",
     "whatever", "somehow", "somewhere", "something", "anything"
-]
+])
 
 # Penalty for vague descriptions (percentage points per vague phrase)
 VAGUENESS_PENALTY = 1.5
@@ -116,7 +128,7 @@ VAGUENESS_PENALTY = 1.5
 # OVERCLAIMING DETECTION
 # =============================================================================
 
-OVERCLAIM_PHRASES: List[str] = [
+OVERCLAIM_PHRASES: Tuple[str, ...] = _phrase_tuple([
     "will change the world", "will revolutionize", "first ever",
     "never been done before", "completely unique", "100% original",
     "no competition", "unmatched", "unparalleled", "unprecedented success",
@@ -124,7 +136,7 @@ OVERCLAIM_PHRASES: List[str] = [
     "backed by research", "studies show", "experts agree",
     "millions of users", "billion dollar", "unicorn potential",
     "viral growth", "exponential", "hockey stick growth"
-]
+])
 
 # Penalty for overclaiming (percentage points per overclaim)
 OVERCLAIM_PENALTY = 3.0
@@ -134,7 +146,7 @@ OVERCLAIM_PENALTY = 3.0
 # POSITIVE SIGNALS (BOOST SCORE)
 # =============================================================================
 
-TECHNICAL_DEPTH_SIGNALS: List[str] = [
+TECHNICAL_DEPTH_SIGNALS: Tuple[str, ...] = _phrase_tuple([
     "algorithm", "architecture", "api", "database", "optimization",
     "performance", "latency", "throughput", "caching", "indexing",
     "authentication", "authorization", "encryption", "security",
@@ -144,27 +156,27 @@ TECHNICAL_DEPTH_SIGNALS: List[str] = [
     "microservices", "containerization", "kubernetes", "docker",
     "rest api", "graphql", "websocket", "real-time",
     "machine learning", "neural network", "model training", "inference"
-]
+])
 
-FEASIBILITY_SIGNALS: List[str] = [
+FEASIBILITY_SIGNALS: Tuple[str, ...] = _phrase_tuple([
     "prototype", "mvp", "working demo", "implemented", "built",
     "deployed", "tested", "validated", "user feedback", "iteration",
     "sprint", "milestone", "roadmap", "timeline", "budget",
     "resource", "constraint", "limitation", "trade-off", "decision"
-]
+])
 
-INNOVATION_SIGNALS: List[str] = [
+INNOVATION_SIGNALS: Tuple[str, ...] = _phrase_tuple([
     "novel approach", "new method", "unique combination", "fresh perspective",
     "different from", "improves upon", "addresses gap", "solves differently",
     "creative solution", "unconventional", "out-of-the-box", "reimagined"
-]
+])
 
 
 # =============================================================================
 # AI-GENERATED TEXT DETECTION PATTERNS
 # =============================================================================
 
-AI_GENERATED_PATTERNS: List[str] = [
+AI_GENERATED_PATTERNS: Tuple[str, ...] = _phrase_tuple([
     "in conclusion", "it is important to note", "it is worth noting",
     "in this regard", "in the realm of", "in today's world",
     "at the end of the day", "moving forward", "going forward",
@@ -174,7 +186,7 @@ AI_GENERATED_PATTERNS: List[str] = [
     "in summary", "to summarize", "in essence", "ultimately",
     "delve into", "dive deeper", "explore further", "shed light on",
     "it's important to", "we need to", "one must", "we should"
-]
+])
 
 # Penalty for suspected AI-generated content
 AI_GENERATED_PENALTY = 5.0
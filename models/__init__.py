@@ -1,7 +1,24 @@
 # Models module for AI Hackathon Judge System
+from importlib import import_module
+
 from .project import HackathonProject, ProjectScore
-from .scoring_engine import ScoringEngine
-from .feedback_generator import FeedbackGenerator, format_score_report
+
+# The scoring engine and feedback generator are imported on first access, so
+# importing just the data models (as the leaderboard does) stays cheap.
+_LAZY_ATTRS = {
+    'ScoringEngine': '.scoring_engine',
+    'FeedbackGenerator': '.feedback_generator',
+    'format_score_report': '.feedback_generator'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'HackathonProject',
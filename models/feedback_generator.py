@@ -6,19 +6,54 @@ improvement suggestions, and verdicts that sound like a real hackathon jury.
 """
 
 import random
-from typing import List, Tuple
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Dict, List, Tuple
 
 from config.settings import (
-    SCORING_CRITERIA, VERDICT_THRESHOLDS, FEEDBACK_TEMPLATES
+    SCORING_CRITERIA, CRITERIA_ORDER, VERDICT_THRESHOLDS, FEEDBACK_TEMPLATES
 )
 from models.project import HackathonProject, ProjectScore
 
 
+# Fallback detail lines for weak criteria whose explanation is too short
+_WEAKNESS_DETAILS: Dict[str, Tuple[str, ...]] = {
+    "innovation": (
+        "The solution doesn't clearly differentiate from existing approaches.",
+        "Consider what unique angle or approach you bring to this problem.",
+        "Innovation should be evident in either the problem framing or solution design."
+    ),
+    "technical_depth": (
+        "The technical implementation lacks specificity.",
+        "Describe your architecture decisions, algorithms, or engineering challenges.",
+        "Judges want to see real engineering effort, not just tool integration."
+    ),
+    "problem_relevance": (
+        "The problem statement needs more clarity on who this affects and why.",
+        "Quantify the problem: how many people? What's the cost? What's the pain?",
+        "A compelling problem makes the solution compelling."
+    ),
+    "feasibility": (
+        "It's unclear whether this can actually be built and deployed.",
+        "What's your MVP? What's achievable in a realistic timeframe?",
+        "Show us that you've thought through the practical implementation."
+    ),
+    "scalability": (
+        "The scaling strategy is not evident.",
+        "What happens when you have 10x, 100x, 1000x the users?",
+        "Consider technical and business scalability."
+    ),
+    "ui_ux": (
+        "User experience considerations are minimal.",
+        "How will users actually interact with this? What's the user journey?",
+        "Even technical products need good UX."
+    ),
+    "real_world_impact": (
+        "The real-world impact is unclear.",
+        "Who benefits and how? What changes because this exists?",
+        "Connect your technical solution to tangible outcomes."
+    )
+}
+
+
 class FeedbackGenerator:
     """
     Generates professional, judge-style feedback for hackathon projects.
@@ -35,6 +70,18 @@ class FeedbackGenerator:
         self.criteria = SCORING_CRITERIA
         self.thresholds = VERDICT_THRESHOLDS
         self.templates = FEEDBACK_TEMPLATES
+        
+        # Strength/weakness headings only depend on the criterion, so build them once
+        self._strength_prefixes = {}
+        self._weakness_prefixes = {}
+        for key, criterion in self.criteria.items():
+            icon, name = criterion["icon"], criterion["name"]
+            self._strength_prefixes[key] = (
+                f"{icon} **Outstanding {name}**", f"{icon} **Strong {name}**"
+            )
+            self._weakness_prefixes[key] = (
+                f"{icon} **Critical Gap in {name}**", f"{icon} **Needs Work: {name}**"
+            )
     
     def generate_feedback(self, project: HackathonProject, score: ProjectScore) -> ProjectScore:
         """
@@ -45,58 +92,53 @@ class FeedbackGenerator:
             score: The calculated scores
             
         Returns:
-            ProjectScore: Updated with feedback, verdict, and explanations
+            ProjectScore: Copy of score with feedback, verdict, and explanations
         """
+        criteria_scores = self._criteria_scores(score)
+        
         # Generate strengths
-        strengths = self._generate_strengths(project, score)
+        strengths = self._generate_strengths(project, score, criteria_scores)
         
         # Generate weaknesses
-        weaknesses = self._generate_weaknesses(project, score)
+        weaknesses = self._generate_weaknesses(project, score, criteria_scores)
         
         # Generate improvement suggestions
         suggestions = self._generate_suggestions(project, score, weaknesses)
         
         # Determine verdict
-        verdict, emoji, explanation = self._determine_verdict(score)
-        
-        # Update and return score object
-        score.strengths = strengths
-        score.weaknesses = weaknesses
-        score.suggestions = suggestions
-        score.verdict = verdict
-        score.verdict_emoji = emoji
-        score.verdict_explanation = explanation
-        
-        return score
+        verdict, emoji, verdict_id, explanation = self._determine_verdict(score)
+        
+        # Scores are frozen, so return an updated copy
+        return score.model_copy(update={
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "suggestions": suggestions,
+            "verdict": verdict,
+            "verdict_emoji": emoji,
+            "verdict_id": verdict_id,
+            "verdict_explanation": explanation
+        })
+    
+    def _criteria_scores(self, score: ProjectScore) -> List[Tuple[str, float, str]]:
+        """Get (criterion, score, explanation) for every criterion."""
+        return [
+            (key, getattr(score, f"{key}_score"), getattr(score, f"{key}_explanation"))
+            for key in CRITERIA_ORDER
+        ]
     
-    def _generate_strengths(self, project: HackathonProject, score: ProjectScore) -> List[str]:
+    def _generate_strengths(self, project: HackathonProject, score: ProjectScore,
+                            criteria_scores: List[Tuple[str, float, str]]) -> List[str]:
         """Identify and articulate project strengths."""
         strengths = []
         
-        # Check each criterion for high scores
-        criteria_scores = [
-            ("innovation", score.innovation_score, score.innovation_explanation),
-            ("technical_depth", score.technical_depth_score, score.technical_depth_explanation),
-            ("problem_relevance", score.problem_relevance_score, score.problem_relevance_explanation),
-            ("feasibility", score.feasibility_score, score.feasibility_explanation),
-            ("scalability", score.scalability_score, score.scalability_explanation),
-            ("ui_ux", score.ui_ux_score, score.ui_ux_explanation),
-            ("real_world_impact", score.real_world_impact_score, score.real_world_impact_explanation)
-        ]
-        
         # Sort by score descending
-        criteria_scores.sort(key=lambda x: x[1], reverse=True)
+        criteria_scores = sorted(criteria_scores, key=lambda x: x[1], reverse=True)
         
         # Take top performers (score >= 70)
         for criterion, criterion_score, explanation in criteria_scores[:4]:
             if criterion_score >= 70:
-                criterion_name = self.criteria[criterion]["name"]
-                icon = self.criteria[criterion]["icon"]
-                
-                if criterion_score >= 85:
-                    prefix = f"{icon} **Outstanding {criterion_name}**"
-                else:
-                    prefix = f"{icon} **Strong {criterion_name}**"
+                outstanding, strong = self._strength_prefixes[criterion]
+                prefix = outstanding if criterion_score >= 85 else strong
                 
                 strengths.append(f"{prefix}: {explanation}")
         
@@ -109,7 +151,7 @@ class FeedbackGenerator:
             strengths.append("✨ **Clean Submission**: No buzzword stuffing or vague claims detected. Clear, honest communication.")
         
         # Add strength for comprehensive submission
-        if project.get_word_count() >= 400:
+        if project.word_count >= 400:
             strengths.append("📝 **Comprehensive Documentation**: Thorough explanation of the project across all sections.")
         
         # Ensure at least one strength
@@ -121,34 +163,19 @@ class FeedbackGenerator:
         
         return strengths[:5]  # Max 5 strengths
     
-    def _generate_weaknesses(self, project: HackathonProject, score: ProjectScore) -> List[str]:
+    def _generate_weaknesses(self, project: HackathonProject, score: ProjectScore,
+                             criteria_scores: List[Tuple[str, float, str]]) -> List[str]:
         """Identify and articulate project weaknesses."""
         weaknesses = []
         
-        # Check each criterion for low scores
-        criteria_scores = [
-            ("innovation", score.innovation_score, score.innovation_explanation),
-            ("technical_depth", score.technical_depth_score, score.technical_depth_explanation),
-            ("problem_relevance", score.problem_relevance_score, score.problem_relevance_explanation),
-            ("feasibility", score.feasibility_score, score.feasibility_explanation),
-            ("scalability", score.scalability_score, score.scalability_explanation),
-            ("ui_ux", score.ui_ux_score, score.ui_ux_explanation),
-            ("real_world_impact", score.real_world_impact_score, score.real_world_impact_explanation)
-        ]
-        
         # Sort by score ascending (worst first)
-        criteria_scores.sort(key=lambda x: x[1])
+        criteria_scores = sorted(criteria_scores, key=lambda x: x[1])
         
         # Take bottom performers (score < 60)
         for criterion, criterion_score, explanation in criteria_scores[:4]:
             if criterion_score < 60:
-                criterion_name = self.criteria[criterion]["name"]
-                icon = self.criteria[criterion]["icon"]
-                
-                if criterion_score < 40:
-                    prefix = f"{icon} **Critical Gap in {criterion_name}**"
-                else:
-                    prefix = f"{icon} **Needs Work: {criterion_name}**"
+                critical, needs_work = self._weakness_prefixes[criterion]
+                prefix = critical if criterion_score < 40 else needs_work
                 
                 # Generate specific weakness feedback
                 weakness_text = self._get_weakness_detail(criterion, criterion_score, explanation)
@@ -175,48 +202,10 @@ class FeedbackGenerator:
     
     def _get_weakness_detail(self, criterion: str, score: float, explanation: str) -> str:
         """Generate specific weakness detail based on criterion."""
-        details = {
-            "innovation": [
-                "The solution doesn't clearly differentiate from existing approaches.",
-                "Consider what unique angle or approach you bring to this problem.",
-                "Innovation should be evident in either the problem framing or solution design."
-            ],
-            "technical_depth": [
-                "The technical implementation lacks specificity.",
-                "Describe your architecture decisions, algorithms, or engineering challenges.",
-                "Judges want to see real engineering effort, not just tool integration."
-            ],
-            "problem_relevance": [
-                "The problem statement needs more clarity on who this affects and why.",
-                "Quantify the problem: how many people? What's the cost? What's the pain?",
-                "A compelling problem makes the solution compelling."
-            ],
-            "feasibility": [
-                "It's unclear whether this can actually be built and deployed.",
-                "What's your MVP? What's achievable in a realistic timeframe?",
-                "Show us that you've thought through the practical implementation."
-            ],
-            "scalability": [
-                "The scaling strategy is not evident.",
-                "What happens when you have 10x, 100x, 1000x the users?",
-                "Consider technical and business scalability."
-            ],
-            "ui_ux": [
-                "User experience considerations are minimal.",
-                "How will users actually interact with this? What's the user journey?",
-                "Even technical products need good UX."
-            ],
-            "real_world_impact": [
-                "The real-world impact is unclear.",
-                "Who benefits and how? What changes because this exists?",
-                "Connect your technical solution to tangible outcomes."
-            ]
-        }
-        
         if explanation and len(explanation) > 20:
             return explanation
         
-        return random.choice(details.get(criterion, ["Needs improvement in this area."]))
+        return random.choice(_WEAKNESS_DETAILS.get(criterion, ("Needs improvement in this area.",)))
     
     def _generate_suggestions(self, project: HackathonProject, score: ProjectScore, 
                              weaknesses: List[str]) -> List[str]:
@@ -249,7 +238,7 @@ class FeedbackGenerator:
         if score.problem_relevance_score < 60:
             suggestions.append("📋 **User Research**: Interview potential users. Real quotes and pain points are compelling.")
         
-        if project.get_word_count() < 200:
+        if project.word_count < 200:
             suggestions.append("📝 **Expand Details**: Add more context to your problem statement and solution description.")
         
         # Add general advice
@@ -258,31 +247,35 @@ class FeedbackGenerator:
         
         return suggestions[:5]  # Max 5 suggestions
     
-    def _determine_verdict(self, score: ProjectScore) -> Tuple[str, str, str]:
+    def _determine_verdict(self, score: ProjectScore) -> Tuple[str, str, int, str]:
         """Determine the final verdict based on score."""
         final = score.final_score
         
         if final >= self.thresholds["winner"][0]:
             verdict = self.thresholds["winner"][2]
             emoji = self.thresholds["winner"][3]
+            verdict_id = self.thresholds["winner"][4]
             explanation = random.choice(self.templates["winner_verdict"])
         
         elif final >= self.thresholds["strong"][0]:
             verdict = self.thresholds["strong"][2]
             emoji = self.thresholds["strong"][3]
+            verdict_id = self.thresholds["strong"][4]
             explanation = random.choice(self.templates["strong_verdict"])
         
         elif final >= self.thresholds["average"][0]:
             verdict = self.thresholds["average"][2]
             emoji = self.thresholds["average"][3]
+            verdict_id = self.thresholds["average"][4]
             explanation = random.choice(self.templates["average_verdict"])
         
         else:
             verdict = self.thresholds["not_ready"][2]
             emoji = self.thresholds["not_ready"][3]
+            verdict_id = self.thresholds["not_ready"][4]
             explanation = random.choice(self.templates["not_ready_verdict"])
         
-        return verdict, emoji, explanation
+        return verdict, emoji, verdict_id, explanation
     
     def generate_comparison_text(self, winner: ProjectScore, runner_up: ProjectScore) -> str:
         """
@@ -6,15 +6,15 @@ This is the core scoring logic that evaluates hackathon projects across
 """
 
 import re
-from typing import Dict, List, Tuple
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ahocorasick
+import numpy as np
 
 from config.settings import (
-    SCORING_CRITERIA, BUZZWORDS, VAGUE_PHRASES, OVERCLAIM_PHRASES,
+    SCORING_CRITERIA, CRITERIA_ORDER, BUZZWORDS, VAGUE_PHRASES, OVERCLAIM_PHRASES,
     TECHNICAL_DEPTH_SIGNALS, FEASIBILITY_SIGNALS, INNOVATION_SIGNALS,
     AI_GENERATED_PATTERNS, MAX_BUZZWORD_DENSITY, BUZZWORD_PENALTY,
     VAGUENESS_PENALTY, OVERCLAIM_PENALTY, AI_GENERATED_PENALTY,
@@ -23,6 +23,80 @@ from config.settings import (
 from models.project import HackathonProject, ProjectScore
 
 
+def _build_automaton(phrases) -> ahocorasick.Automaton:
+    """Compile phrases into a single Aho-Corasick automaton (phrase -> phrase)."""
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_up_to(phrases: Tuple[str, ...], text: str, cap: int) -> int:
+    """
+    Count phrases that occur in text, stopping once cap is reached.
+    
+    For checks that only compare the count against thresholds <= cap.
+    """
+    count = 0
+    for phrase in phrases:
+        if phrase in text:
+            count += 1
+            if count >= cap:
+                break
+    return count
+
+
+# Keyword groups the criteria check against the full submission text
+_DOCUMENTATION_KEYWORDS = frozenset(("readme", "documentation"))
+_UX_KEYWORDS = frozenset((
+    "user experience", "user interface", "ui", "ux", "design",
+    "intuitive", "user-friendly", "accessible", "responsive",
+    "figma", "mockup", "wireframe", "usability", "user testing",
+    "user research", "persona", "journey"
+))
+_ACCESSIBILITY_KEYWORDS = frozenset(("accessib", "wcag", "a11y"))
+_IMPACT_KEYWORDS = frozenset((
+    "impact", "benefit", "improve", "save time", "save money",
+    "reduce", "increase", "help", "solve", "address",
+    "community", "society", "environment", "sustainable"
+))
+
+# Keyword groups the criteria check against individual fields
+_DIFFERENTIATORS = ("unlike", "different from", "improves", "addresses gap", "first to")
+_GENERIC_PHRASES = ("use ai", "machine learning solution", "web app", "mobile app")
+_PAIN_INDICATORS = (
+    "struggle", "challenge", "difficult", "problem", "issue",
+    "pain point", "frustrat", "inefficient", "costly", "time-consuming"
+)
+_AUDIENCE_INDICATORS = (
+    "developer", "student", "enterprise", "small business",
+    "healthcare", "education", "finance", "retail", "startup"
+)
+_SCOPE_INDICATORS = ("mvp", "prototype", "phase 1", "initial version", "proof of concept")
+_AMBITIOUS_PHRASES = ("entire industry", "all users", "everyone", "complete solution")
+_SCALE_KEYWORDS = (
+    "scale", "scalab", "microservice", "cloud", "distributed",
+    "horizontal", "vertical", "load balanc", "container", "kubernetes",
+    "elastic", "auto-scal", "serverless"
+)
+_EXTEND_KEYWORDS = ("plugin", "modular", "extensible", "api", "integration", "customize")
+_SUSTAIN_KEYWORDS = ("revenue", "monetiz", "subscription", "freemium", "enterprise", "pricing")
+_FRONTEND_TECHS = ("react", "vue", "angular", "svelte", "tailwind", "css", "figma")
+
+# Supporting statistics and quantified impact claims in the full text
+_STATS_RE = re.compile(r'\d+%|\d+ million|\d+ billion|\d+ users')
+_QUANTIFIED_IMPACT_RE = re.compile(r'\d+%\s*(?:faster|better|cheaper|reduction|improvement)')
+
+# Every phrase that is checked against the full submission text (the
+# settings lists are already lowercased), matched in one linear pass
+_PHRASE_AUTOMATON = _build_automaton((
+    *BUZZWORDS, *VAGUE_PHRASES, *OVERCLAIM_PHRASES, *AI_GENERATED_PATTERNS,
+    *TECHNICAL_DEPTH_SIGNALS, *FEASIBILITY_SIGNALS, *INNOVATION_SIGNALS,
+    *_DOCUMENTATION_KEYWORDS, *_UX_KEYWORDS, *_ACCESSIBILITY_KEYWORDS, *_IMPACT_KEYWORDS
+))
+
+
 class ScoringEngine:
     """
     Core scoring engine for evaluating hackathon projects.
@@ -36,16 +110,21 @@ class ScoringEngine:
     - Adjusts expectations based on project complexity
     """
     
+    # Sets, so counting the phrases among the automaton matches is one
+    # intersection (the lists hold no duplicates, so counts are unchanged).
+    # Built once at import and shared by every engine instance.
+    buzzwords = frozenset(BUZZWORDS)
+    vague_phrases = frozenset(VAGUE_PHRASES)
+    overclaim_phrases = frozenset(OVERCLAIM_PHRASES)
+    ai_patterns = frozenset(AI_GENERATED_PATTERNS)
+    tech_signals = frozenset(TECHNICAL_DEPTH_SIGNALS)
+    feasibility_signals = frozenset(FEASIBILITY_SIGNALS)
+    innovation_signals = frozenset(INNOVATION_SIGNALS)
+    
     def __init__(self):
         """Initialize the scoring engine with configuration."""
         self.criteria = SCORING_CRITERIA
-        self.buzzwords = [b.lower() for b in BUZZWORDS]
-        self.vague_phrases = [v.lower() for v in VAGUE_PHRASES]
-        self.overclaim_phrases = [o.lower() for o in OVERCLAIM_PHRASES]
-        self.ai_patterns = [a.lower() for a in AI_GENERATED_PATTERNS]
-        self.tech_signals = [t.lower() for t in TECHNICAL_DEPTH_SIGNALS]
-        self.feasibility_signals = [f.lower() for f in FEASIBILITY_SIGNALS]
-        self.innovation_signals = [i.lower() for i in INNOVATION_SIGNALS]
+        self.weights = tuple(self.criteria[key]["weight"] / 100 for key in CRITERIA_ORDER)
     
     def evaluate_project(self, project: HackathonProject) -> ProjectScore:
         """
@@ -57,55 +136,159 @@ class ScoringEngine:
         Returns:
             ProjectScore: Complete evaluation with scores, penalties, and feedback
         """
+        criterion_results, penalties, complexity_multiplier = self._analyze(project)
+        total_penalty = penalties[4]
+        
+        # Calculate weighted raw score, adding left to right like the batch
+        # path; sum() uses compensated summation on Python 3.12+, which rounds
+        # differently on .x5 boundaries
+        raw_score = 0.0
+        for (score, _), weight in zip(criterion_results, self.weights):
+            raw_score += score * weight
+        
+        # Apply complexity multiplier and penalties
+        final_score = max(0, min(100, (raw_score * complexity_multiplier) - total_penalty))
+        
+        return self._build_score(project, criterion_results, penalties, raw_score, final_score)
+    
+    def evaluate_batch(self, projects: List[HackathonProject]) -> List[ProjectScore]:
+        """
+        Evaluate several projects in one call.
+        
+        Text analysis still runs per project, but the weighted scores,
+        complexity multipliers and penalties of the whole batch are combined
+        as NumPy arrays. Results are identical to calling evaluate_project
+        on each project.
+        
+        Args:
+            projects: The hackathon projects to evaluate
+            
+        Returns:
+            List[ProjectScore]: One evaluation per project, in input order
+        """
+        analyses = [self._analyze(project) for project in projects]
+        if not analyses:
+            return []
+        
+        # (N, 7) matrix of criterion scores in CRITERIA_ORDER
+        scores = np.array(
+            [[score for score, _ in results] for results, _, _ in analyses],
+            dtype=np.float64
+        )
+        total_penalties = np.array([penalties[4] for _, penalties, _ in analyses])
+        multipliers = np.array([multiplier for _, _, multiplier in analyses])
+        
+        # Accumulate column by column rather than with a matrix product, so
+        # every sum is rounded exactly as in evaluate_project
+        raw_scores = np.zeros(len(analyses))
+        for column, weight in enumerate(self.weights):
+            raw_scores += scores[:, column] * weight
+        
+        final_scores = np.clip(raw_scores * multipliers - total_penalties, 0, 100)
+        
+        return [
+            self._build_score(project, results, penalties, float(raw_score), float(final_score))
+            for project, (results, penalties, _), raw_score, final_score
+            in zip(projects, analyses, raw_scores, final_scores)
+        ]
+    
+    def evaluate_batch_parallel(self, projects: List[HackathonProject],
+                                n_workers: Optional[int] = None) -> List[ProjectScore]:
+        """
+        Evaluate several projects across a pool of worker processes.
+        
+        Projects are scored independently, so the batch is split into
+        chunks and each worker evaluates its chunk with its own engine
+        (built once per worker by _init_worker). Small batches, or a single
+        worker, are evaluated in-process with evaluate_batch. As with any
+        process pool, callers on spawn-based platforms must run this under
+        an ``if __name__ == "__main__":`` guard.
+        
+        Args:
+            projects: The hackathon projects to evaluate
+            n_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List[ProjectScore]: One evaluation per project, in input order
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers <= 1 or len(projects) < 2:
+            return self.evaluate_batch(projects)
+        
+        chunksize = max(1, len(projects) // (n_workers * 4))
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_evaluate_in_worker, projects, chunksize=chunksize))
+    
+    def _analyze(self, project: HackathonProject) -> Tuple[List[Tuple[float, str]], Tuple[float, ...], float]:
+        """
+        Run the per-project text analysis.
+        
+        Returns:
+            Tuple of ((score, explanation) per criterion in CRITERIA_ORDER,
+            (buzzword, vagueness, overclaim, ai_generated, total) penalties,
+            complexity multiplier)
+        """
         # Get all text for analysis
-        full_text = project.get_all_text().lower()
-        word_count = project.get_word_count()
+        lowered = project.lowered
+        full_text = lowered["full_text_lower"]
+        word_count = project.word_count
         
         # Determine project complexity level
         complexity_level = self._determine_complexity(project)
         
+        # Find every configured phrase present in the text in one pass
+        matches = self._find_phrases(full_text)
+        
         # Score each criterion
-        innovation_score, innovation_exp = self._score_innovation(project, full_text)
-        technical_score, technical_exp = self._score_technical_depth(project, full_text)
-        relevance_score, relevance_exp = self._score_problem_relevance(project, full_text)
-        feasibility_score, feasibility_exp = self._score_feasibility(project, full_text)
-        scalability_score, scalability_exp = self._score_scalability(project, full_text)
-        ui_ux_score, ui_ux_exp = self._score_ui_ux(project, full_text)
-        impact_score, impact_exp = self._score_real_world_impact(project, full_text)
+        criterion_results = [
+            self._score_innovation(project, matches),
+            self._score_technical_depth(project, matches),
+            self._score_problem_relevance(project, full_text),
+            self._score_feasibility(project, matches),
+            self._score_scalability(project),
+            self._score_ui_ux(project, matches),
+            self._score_real_world_impact(project, full_text, matches)
+        ]
         
         # Calculate penalties
-        buzzword_penalty = self._calculate_buzzword_penalty(full_text, word_count)
-        vagueness_penalty = self._calculate_vagueness_penalty(full_text)
-        overclaim_penalty = self._calculate_overclaim_penalty(full_text)
-        ai_penalty = self._calculate_ai_generated_penalty(full_text)
+        buzzword_penalty = self._calculate_buzzword_penalty(matches, word_count)
+        vagueness_penalty = self._calculate_vagueness_penalty(matches)
+        overclaim_penalty = self._calculate_overclaim_penalty(matches)
+        ai_penalty = self._calculate_ai_generated_penalty(matches)
         
         total_penalty = min(30, buzzword_penalty + vagueness_penalty + overclaim_penalty + ai_penalty)
+        penalties = (buzzword_penalty, vagueness_penalty, overclaim_penalty, ai_penalty, total_penalty)
         
-        # Calculate weighted raw score
-        raw_score = (
-            innovation_score * (self.criteria["innovation"]["weight"] / 100) +
-            technical_score * (self.criteria["technical_depth"]["weight"] / 100) +
-            relevance_score * (self.criteria["problem_relevance"]["weight"] / 100) +
-            feasibility_score * (self.criteria["feasibility"]["weight"] / 100) +
-            scalability_score * (self.criteria["scalability"]["weight"] / 100) +
-            ui_ux_score * (self.criteria["ui_ux"]["weight"] / 100) +
-            impact_score * (self.criteria["real_world_impact"]["weight"] / 100)
-        )
-        
-        # Apply complexity multiplier and penalties
         complexity_multiplier = COMPLEXITY_LEVELS[complexity_level]["score_multiplier"]
-        final_score = max(0, min(100, (raw_score * complexity_multiplier) - total_penalty))
         
-        # Create and return the score object
-        return ProjectScore(
+        return criterion_results, penalties, complexity_multiplier
+    
+    def _build_score(self, project: HackathonProject, criterion_results: List[Tuple[float, str]],
+                     penalties: Tuple[float, ...], raw_score: float, final_score: float) -> ProjectScore:
+        """Assemble the ProjectScore from the analysis and the aggregated scores."""
+        (
+            (innovation_score, innovation_exp),
+            (technical_score, technical_exp),
+            (relevance_score, relevance_exp),
+            (feasibility_score, feasibility_exp),
+            (scalability_score, scalability_exp),
+            (ui_ux_score, ui_ux_exp),
+            (impact_score, impact_exp)
+        ) = criterion_results
+        buzzword_penalty, vagueness_penalty, overclaim_penalty, ai_penalty, total_penalty = penalties
+        
+        # Create and return the score object. The values are computed here and
+        # already within bounds, so skip validation; the casts do the int ->
+        # float coercion it used to perform.
+        return ProjectScore.model_construct(
             project_title=project.project_title,
-            innovation_score=innovation_score,
-            technical_depth_score=technical_score,
-            problem_relevance_score=relevance_score,
-            feasibility_score=feasibility_score,
-            scalability_score=scalability_score,
-            ui_ux_score=ui_ux_score,
-            real_world_impact_score=impact_score,
+            innovation_score=float(innovation_score),
+            technical_depth_score=float(technical_score),
+            problem_relevance_score=float(relevance_score),
+            feasibility_score=float(feasibility_score),
+            scalability_score=float(scalability_score),
+            ui_ux_score=float(ui_ux_score),
+            real_world_impact_score=float(impact_score),
             innovation_explanation=innovation_exp,
             technical_depth_explanation=technical_exp,
             problem_relevance_explanation=relevance_exp,
@@ -113,18 +296,19 @@ class ScoringEngine:
             scalability_explanation=scalability_exp,
             ui_ux_explanation=ui_ux_exp,
             real_world_impact_explanation=impact_exp,
-            buzzword_penalty=buzzword_penalty,
-            vagueness_penalty=vagueness_penalty,
-            overclaim_penalty=overclaim_penalty,
-            ai_generated_penalty=ai_penalty,
-            total_penalty=total_penalty,
-            raw_score=round(raw_score, 1),
-            final_score=round(final_score, 1)
+            buzzword_penalty=float(buzzword_penalty),
+            vagueness_penalty=float(vagueness_penalty),
+            overclaim_penalty=float(overclaim_penalty),
+            ai_generated_penalty=float(ai_penalty),
+            total_penalty=float(total_penalty),
+            raw_score=float(round(raw_score, 1)),
+            final_score=float(round(final_score, 1))
         )
     
     def _determine_complexity(self, project: HackathonProject) -> str:
         """Determine the complexity level of a project based on team size and tech stack."""
-        tech_count = len(project.tech_stack.split(','))
+        # Same as len(tech_stack.split(',')) without building the list
+        tech_count = project.tech_stack.count(',') + 1
         
         if project.team_size <= 2 and tech_count <= 3:
             return "beginner"
@@ -133,7 +317,7 @@ class ScoringEngine:
         else:
             return "intermediate"
     
-    def _score_innovation(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_innovation(self, project: HackathonProject, matches: Set[str]) -> Tuple[float, str]:
         """
         Score the innovation and originality of the project.
         
@@ -146,7 +330,7 @@ class ScoringEngine:
         reasons = []
         
         # Check for innovation signals
-        innovation_count = sum(1 for signal in self.innovation_signals if signal in full_text)
+        innovation_count = len(matches & self.innovation_signals)
         if innovation_count >= 3:
             score += 25
             reasons.append("Strong innovation signals detected")
@@ -155,21 +339,19 @@ class ScoringEngine:
             reasons.append("Some innovative elements present")
         
         # Check innovation description quality
-        innovation_text = project.innovation_description.lower()
+        innovation_text = project.lowered["innovation_description"]
         if len(innovation_text.split()) >= 50:
             score += 10
             reasons.append("Detailed innovation explanation")
         
         # Check for specific differentiators
-        differentiators = ["unlike", "different from", "improves", "addresses gap", "first to"]
-        diff_count = sum(1 for d in differentiators if d in innovation_text)
+        diff_count = _count_up_to(_DIFFERENTIATORS, innovation_text, 2)
         if diff_count >= 2:
             score += 10
             reasons.append("Clear differentiation from existing solutions")
         
         # Check for generic descriptions (penalty)
-        generic_phrases = ["use ai", "machine learning solution", "web app", "mobile app"]
-        generic_count = sum(1 for g in generic_phrases if g in innovation_text)
+        generic_count = _count_up_to(_GENERIC_PHRASES, innovation_text, 2)
         if generic_count >= 2:
             score -= 15
             reasons.append("Innovation description is too generic")
@@ -179,7 +361,7 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _score_technical_depth(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_technical_depth(self, project: HackathonProject, matches: Set[str]) -> Tuple[float, str]:
         """
         Score the technical sophistication of the project.
         
@@ -192,7 +374,7 @@ class ScoringEngine:
         reasons = []
         
         # Count technical signals
-        tech_signal_count = sum(1 for signal in self.tech_signals if signal in full_text)
+        tech_signal_count = len(matches & self.tech_signals)
         if tech_signal_count >= 10:
             score += 35
             reasons.append("Excellent technical depth with specific implementation details")
@@ -206,7 +388,7 @@ class ScoringEngine:
             reasons.append("Lacks technical specificity")
         
         # Analyze tech stack
-        tech_stack = project.tech_stack.lower()
+        tech_stack = project.lowered["tech_stack"]
         tech_categories_used = 0
         for category, techs in TECH_CATEGORIES.items():
             if any(tech in tech_stack for tech in techs):
@@ -220,7 +402,7 @@ class ScoringEngine:
             reasons.append("Reasonable tech stack variety")
         
         # Check solution description for technical depth
-        solution = project.solution_description.lower()
+        solution = project.lowered["solution_description"]
         if "architecture" in solution or "system design" in solution:
             score += 5
             reasons.append("Discusses system architecture")
@@ -246,21 +428,20 @@ class ScoringEngine:
         score = 50  # Base score
         reasons = []
         
-        problem = project.problem_statement.lower()
-        target = project.target_users.lower()
+        problem = project.lowered["problem_statement"]
+        target = project.lowered["target_users"]
         
         # Check problem statement quality
-        if len(problem.split()) >= 75:
+        problem_words = len(problem.split())
+        if problem_words >= 75:
             score += 15
             reasons.append("Thorough problem description")
-        elif len(problem.split()) >= 40:
+        elif problem_words >= 40:
             score += 8
             reasons.append("Adequate problem description")
         
         # Check for specific pain points
-        pain_indicators = ["struggle", "challenge", "difficult", "problem", "issue", 
-                          "pain point", "frustrat", "inefficient", "costly", "time-consuming"]
-        pain_count = sum(1 for p in pain_indicators if p in problem)
+        pain_count = _count_up_to(_PAIN_INDICATORS, problem, 3)
         if pain_count >= 3:
             score += 15
             reasons.append("Clear articulation of pain points")
@@ -269,9 +450,7 @@ class ScoringEngine:
             reasons.append("Some pain points identified")
         
         # Check target audience specificity
-        specific_indicators = ["developer", "student", "enterprise", "small business", 
-                               "healthcare", "education", "finance", "retail", "startup"]
-        specific_count = sum(1 for s in specific_indicators if s in target)
+        specific_count = _count_up_to(_AUDIENCE_INDICATORS, target, 2)
         if specific_count >= 2:
             score += 10
             reasons.append("Well-defined target audience")
@@ -280,7 +459,7 @@ class ScoringEngine:
             reasons.append("Target audience mentioned")
         
         # Check for data/statistics (adds credibility)
-        if re.search(r'\d+%|\d+ million|\d+ billion|\d+ users', full_text):
+        if _STATS_RE.search(full_text):
             score += 10
             reasons.append("Includes supporting data/statistics")
         
@@ -289,7 +468,7 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _score_feasibility(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_feasibility(self, project: HackathonProject, matches: Set[str]) -> Tuple[float, str]:
         """
         Score how feasible the project is to build and deploy.
         
@@ -302,7 +481,7 @@ class ScoringEngine:
         reasons = []
         
         # Check for feasibility signals
-        feasibility_count = sum(1 for signal in self.feasibility_signals if signal in full_text)
+        feasibility_count = len(matches & self.feasibility_signals)
         if feasibility_count >= 5:
             score += 30
             reasons.append("Strong evidence of practical implementation")
@@ -315,22 +494,19 @@ class ScoringEngine:
             score += 20
             reasons.append("Working demo available")
         
-        # Check for GitHub link quality hints
-        github = project.github_link.lower()
-        if "readme" in full_text or "documentation" in full_text:
+        # Check for documentation hints
+        if matches & _DOCUMENTATION_KEYWORDS:
             score += 5
             reasons.append("Documentation mentioned")
         
         # Check for realistic scope indicators
-        solution = project.solution_description.lower()
-        scope_indicators = ["mvp", "prototype", "phase 1", "initial version", "proof of concept"]
-        if any(s in solution for s in scope_indicators):
+        solution = project.lowered["solution_description"]
+        if any(s in solution for s in _SCOPE_INDICATORS):
             score += 10
             reasons.append("Realistic scope with phased approach")
         
         # Penalty for over-ambitious claims without evidence
-        ambitious = ["entire industry", "all users", "everyone", "complete solution"]
-        if any(a in solution for a in ambitious) and not project.demo_link:
+        if any(a in solution for a in _AMBITIOUS_PHRASES) and not project.demo_link:
             score -= 10
             reasons.append("Ambitious scope without demo evidence")
         
@@ -339,7 +515,7 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _score_scalability(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_scalability(self, project: HackathonProject) -> Tuple[float, str]:
         """
         Score the scalability potential of the project.
         
@@ -351,15 +527,12 @@ class ScoringEngine:
         score = 45  # Base score
         reasons = []
         
-        future = project.future_scope.lower()
-        solution = project.solution_description.lower()
+        future = project.lowered["future_scope"]
+        solution = project.lowered["solution_description"]
         combined = future + " " + solution
         
         # Check for scalability keywords
-        scale_keywords = ["scale", "scalab", "microservice", "cloud", "distributed",
-                         "horizontal", "vertical", "load balanc", "container", "kubernetes",
-                         "elastic", "auto-scal", "serverless"]
-        scale_count = sum(1 for k in scale_keywords if k in combined)
+        scale_count = _count_up_to(_SCALE_KEYWORDS, combined, 4)
         
         if scale_count >= 4:
             score += 30
@@ -374,15 +547,13 @@ class ScoringEngine:
             reasons.append("Detailed future roadmap")
         
         # Check for extensibility
-        extend_keywords = ["plugin", "modular", "extensible", "api", "integration", "customize"]
-        extend_count = sum(1 for e in extend_keywords if e in combined)
+        extend_count = _count_up_to(_EXTEND_KEYWORDS, combined, 2)
         if extend_count >= 2:
             score += 10
             reasons.append("Good extensibility considerations")
         
         # Check for monetization/sustainability
-        sustain_keywords = ["revenue", "monetiz", "subscription", "freemium", "enterprise", "pricing"]
-        if any(s in combined for s in sustain_keywords):
+        if any(s in combined for s in _SUSTAIN_KEYWORDS):
             score += 5
             reasons.append("Business sustainability considered")
         
@@ -391,7 +562,7 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _score_ui_ux(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_ui_ux(self, project: HackathonProject, matches: Set[str]) -> Tuple[float, str]:
         """
         Score the UI/UX and presentation quality.
         
@@ -404,11 +575,7 @@ class ScoringEngine:
         reasons = []
         
         # Check for UI/UX keywords
-        ux_keywords = ["user experience", "user interface", "ui", "ux", "design",
-                      "intuitive", "user-friendly", "accessible", "responsive",
-                      "figma", "mockup", "wireframe", "usability", "user testing",
-                      "user research", "persona", "journey"]
-        ux_count = sum(1 for k in ux_keywords if k in full_text)
+        ux_count = len(matches & _UX_KEYWORDS)
         
         if ux_count >= 5:
             score += 25
@@ -423,14 +590,13 @@ class ScoringEngine:
             reasons.append("Demo available for visual assessment")
         
         # Check for frontend technologies
-        tech = project.tech_stack.lower()
-        frontend_techs = ["react", "vue", "angular", "svelte", "tailwind", "css", "figma"]
-        if any(f in tech for f in frontend_techs):
+        tech = project.lowered["tech_stack"]
+        if any(f in tech for f in _FRONTEND_TECHS):
             score += 10
             reasons.append("Modern frontend technology stack")
         
         # Check for accessibility
-        if "accessib" in full_text or "wcag" in full_text or "a11y" in full_text:
+        if matches & _ACCESSIBILITY_KEYWORDS:
             score += 10
             reasons.append("Accessibility considered")
         
@@ -439,7 +605,8 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _score_real_world_impact(self, project: HackathonProject, full_text: str) -> Tuple[float, str]:
+    def _score_real_world_impact(self, project: HackathonProject, full_text: str,
+                                 matches: Set[str]) -> Tuple[float, str]:
         """
         Score the potential real-world impact.
         
@@ -452,10 +619,7 @@ class ScoringEngine:
         reasons = []
         
         # Check for impact keywords
-        impact_keywords = ["impact", "benefit", "improve", "save time", "save money",
-                          "reduce", "increase", "help", "solve", "address",
-                          "community", "society", "environment", "sustainable"]
-        impact_count = sum(1 for k in impact_keywords if k in full_text)
+        impact_count = len(matches & _IMPACT_KEYWORDS)
         
         if impact_count >= 6:
             score += 25
@@ -465,12 +629,12 @@ class ScoringEngine:
             reasons.append("Some impact considerations")
         
         # Check for quantified impact
-        if re.search(r'\d+%\s*(faster|better|cheaper|reduction|improvement)', full_text):
+        if _QUANTIFIED_IMPACT_RE.search(full_text):
             score += 15
             reasons.append("Quantified impact metrics")
         
         # Check for specific beneficiaries
-        target = project.target_users.lower()
+        target = project.lowered["target_users"]
         if len(target.split()) >= 30:
             score += 10
             reasons.append("Well-defined beneficiary group")
@@ -480,9 +644,13 @@ class ScoringEngine:
         
         return score, explanation
     
-    def _calculate_buzzword_penalty(self, text: str, word_count: int) -> float:
+    def _find_phrases(self, text: str) -> Set[str]:
+        """Return the distinct configured phrases that occur anywhere in text."""
+        return {phrase for _, phrase in _PHRASE_AUTOMATON.iter(text)}
+    
+    def _calculate_buzzword_penalty(self, matches: Set[str], word_count: int) -> float:
         """Calculate penalty for buzzword stuffing."""
-        buzzword_count = sum(1 for bw in self.buzzwords if bw in text)
+        buzzword_count = len(matches & self.buzzwords)
         
         # Calculate density (buzzwords per 100 words)
         density = (buzzword_count / max(1, word_count)) * 100
@@ -493,30 +661,45 @@ class ScoringEngine:
         
         return 0.0
     
-    def _calculate_vagueness_penalty(self, text: str) -> float:
+    def _calculate_vagueness_penalty(self, matches: Set[str]) -> float:
         """Calculate penalty for vague descriptions."""
-        vague_count = sum(1 for vp in self.vague_phrases if vp in text)
+        vague_count = len(matches & self.vague_phrases)
         
         if vague_count > 3:
             return min(10, (vague_count - 3) * VAGUENESS_PENALTY)
         
         return 0.0
     
-    def _calculate_overclaim_penalty(self, text: str) -> float:
+    def _calculate_overclaim_penalty(self, matches: Set[str]) -> float:
         """Calculate penalty for overclaiming without evidence."""
-        overclaim_count = sum(1 for oc in self.overclaim_phrases if oc in text)
+        overclaim_count = len(matches & self.overclaim_phrases)
         
         if overclaim_count > 0:
             return min(15, overclaim_count * OVERCLAIM_PENALTY)
         
         return 0.0
     
-    def _calculate_ai_generated_penalty(self, text: str) -> float:
+    def _calculate_ai_generated_penalty(self, matches: Set[str]) -> float:
         """Calculate penalty for suspected AI-generated content."""
-        ai_pattern_count = sum(1 for ap in self.ai_patterns if ap in text)
+        ai_pattern_count = len(matches & self.ai_patterns)
         
         # High threshold - we don't want false positives
         if ai_pattern_count >= 5:
             return AI_GENERATED_PENALTY
         
         return 0.0
+
+
+# Engine owned by each evaluate_batch_parallel worker process
+_WORKER_ENGINE: Optional[ScoringEngine] = None
+
+
+def _init_worker() -> None:
+    """Build the worker's engine once, when the pool starts the process."""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = ScoringEngine()
+
+
+def _evaluate_in_worker(project: HackathonProject) -> ProjectScore:
+    """Score one project inside a worker process."""
+    return _WORKER_ENGINE.evaluate_project(project)
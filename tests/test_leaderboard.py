@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+from models.project import ProjectScore
+from utils.leaderboard import Leaderboard
+
+
+def make_score(title, final_score):
+    """Build a minimal ProjectScore for leaderboard tests."""
+    criteria = {
+        name: final_score for name in (
+            "innovation_score", "technical_depth_score", "problem_relevance_score",
+            "feasibility_score", "scalability_score", "ui_ux_score",
+            "real_world_impact_score"
+        )
+    }
+    return ProjectScore(
+        project_title=title,
+        raw_score=final_score,
+        final_score=final_score,
+        **criteria
+    )
+
+
+def read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_add_project_appends_one_line(tmp_path):
+    """Each submission appends a row instead of rewriting the file."""
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+    board.add_project(make_score("Alpha", 60))
+    board.add_project(make_score("Beta", 80))
+    board.flush()
+
+    assert [row["project_title"] for row in read_lines(path)] == ["Alpha", "Beta"]
+
+    reloaded = Leaderboard(path)
+    assert [p["project_title"] for p in reloaded.get_rankings()] == ["Beta", "Alpha"]
+
+
+def test_remove_project_survives_reload(tmp_path):
+    """Removals are replayed from tombstones and trigger compaction."""
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+    for i, title in enumerate(["Alpha", "Beta", "Gamma"]):
+        board.add_project(make_score(title, 50 + i))
+
+    assert board.remove_project("beta")
+    board.flush()
+    assert len(read_lines(path)) == 4
+    assert [p["project_title"] for p in Leaderboard(path).get_rankings()] == ["Gamma", "Alpha"]
+
+    # Five lines for one live row: compacted down to just that row
+    board.remove_project("gamma")
+    board.flush()
+    assert [row["project_title"] for row in read_lines(path)] == ["Alpha"]
+
+
+def test_load_skips_truncated_line(tmp_path):
+    """A line cut short by a crash doesn't lose the rest of the board."""
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+    board.add_project(make_score("Alpha", 60))
+    board.flush()
+    with open(path, "a") as f:
+        f.write('{"project_title": "Bet')
+
+    assert [p["project_title"] for p in Leaderboard(path).get_rankings()] == ["Alpha"]
+
+
+def test_ties_keep_submission_order():
+    """Equal scores rank in the order they were submitted."""
+    board = Leaderboard()
+    assert board.add_project(make_score("Alpha", 70)) == 1
+    assert board.add_project(make_score("Beta", 70)) == 2
+    assert board.add_project(make_score("Gamma", 90)) == 1
+
+    assert [p["project_title"] for p in board.get_rankings()] == ["Gamma", "Alpha", "Beta"]
+
+
+def test_clear_supersedes_queued_appends(tmp_path):
+    """A rewrite queued after appends leaves only the rows that follow it."""
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+    for i in range(20):
+        board.add_project(make_score(f"Project {i}", 50))
+    board.clear()
+    board.add_project(make_score("Omega", 90))
+    board.flush()
+
+    assert [row["project_title"] for row in read_lines(path)] == ["Omega"]
+    assert [p["project_title"] for p in Leaderboard(path).get_rankings()] == ["Omega"]
+
+
+def test_array_mode_reads_and_rewrites_json_array(tmp_path):
+    """append_mode=False keeps the older single JSON array file format."""
+    path = str(tmp_path / "leaderboard.json")
+    board = Leaderboard(path, append_mode=False)
+    board.add_project(make_score("Alpha", 60))
+    board.add_project(make_score("Beta", 80))
+    board.remove_project("alpha")
+    board.flush()
+
+    with open(path) as f:
+        assert [row["project_title"] for row in json.load(f)] == ["Beta"]
+    reloaded = Leaderboard(path, append_mode=False)
+    assert [p["project_title"] for p in reloaded.get_rankings()] == ["Beta"]
+
+
+def test_log_is_seeded_from_older_array_file(tmp_path):
+    """A board saved as leaderboard.json carries over to leaderboard.jsonl."""
+    array_board = Leaderboard(str(tmp_path / "leaderboard.json"), append_mode=False)
+    array_board.add_project(make_score("Alpha", 60))
+    array_board.add_project(make_score("Beta", 80))
+    array_board.flush()
+
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+    assert [p["project_title"] for p in board.get_rankings()] == ["Beta", "Alpha"]
+    board.add_project(make_score("Gamma", 70))
+    board.flush()
+
+    assert [row["project_title"] for row in read_lines(path)] == ["Beta", "Alpha", "Gamma"]
+    assert [p["project_title"] for p in Leaderboard(path).get_rankings()] == ["Beta", "Gamma", "Alpha"]
+
+
+def test_failed_write_is_raised_and_retried(tmp_path, monkeypatch):
+    """A write error reaches the caller and the rows stay queued for retry."""
+    path = str(tmp_path / "leaderboard.jsonl")
+    board = Leaderboard(path)
+
+    def failing_open(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("utils.leaderboard.open", failing_open, raising=False)
+    board.add_project(make_score("Alpha", 60))
+    with pytest.raises(OSError, match="disk full"):
+        board.flush()
+    board.add_project(make_score("Beta", 80))
+    with pytest.raises(OSError, match="disk full"):
+        board.flush()
+
+    monkeypatch.undo()
+    board.flush()
+    assert [row["project_title"] for row in read_lines(path)] == ["Alpha", "Beta"]
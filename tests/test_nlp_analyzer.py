@@ -0,0 +1,30 @@
+from utils.nlp_analyzer import NLPAnalyzer
+
+
+def test_tokenize_drops_punctuation_stop_words_and_short_words():
+    """Tokens are lowercased words of three or more characters."""
+    analyzer = NLPAnalyzer()
+    assert analyzer._tokenize("The API, built in Go & Rust_v2!") == ["api", "built", "rust_v2"]
+
+
+def test_analyze_batch_matches_analyze_text_except_key_concepts():
+    """Batch results share analyze_text's metrics; concepts come from TF-IDF."""
+    analyzer = NLPAnalyzer()
+    texts = [
+        "Students track study habits. The app tracks focus and study streaks.",
+        "Farmers track soil moisture. Sensors send soil data to the cloud.",
+        "",
+    ]
+    batch = analyzer.analyze_batch(texts)
+
+    assert len(batch) == 3
+    for text, result in zip(texts, batch):
+        single = analyzer.analyze_text(text)
+        single.pop("key_concepts")
+        assert {k: v for k, v in result.items() if k != "key_concepts"} == single
+
+    # "track" appears in both texts, so it ranks below each text's own terms
+    assert batch[0]["key_concepts"][0] == "study"
+    assert batch[1]["key_concepts"][0] == "soil"
+    assert batch[2]["key_concepts"] == []
+    assert analyzer.analyze_batch([]) == []
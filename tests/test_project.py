@@ -0,0 +1,35 @@
+from models.project import HackathonProject
+
+
+def make_project(**overrides):
+    """Build a valid HackathonProject for model tests."""
+    fields = dict(
+        project_title="StudyBuddy",
+        team_size=3,
+        problem_statement="Students lose track of study habits and miss deadlines every term.",
+        solution_description=(
+            "A web app that tracks study sessions, sends reminders and shows "
+            "weekly focus reports built from calendar and timer data."
+        ),
+        tech_stack="Python, FastAPI, React",
+        innovation_description="Combines calendar data with focus timers to predict crunch weeks.",
+        github_link="https://github.com/example/studybuddy",
+        target_users="University students and tutors",
+        future_scope="Add group study rooms and integrate with campus learning platforms.",
+    )
+    fields.update(overrides)
+    return HackathonProject(**fields)
+
+
+def test_model_copy_recomputes_cached_text():
+    """Cached derived values follow the copy's fields, not the original's."""
+    project = make_project()
+    assert project.word_count == len(project.get_all_text().split())
+    assert "students" in project.lowered["problem_statement"]
+
+    copied = project.model_copy(update={"problem_statement": "Only Four Words Here"})
+
+    assert copied.word_count == project.word_count - len(project.problem_statement.split()) + 4
+    assert "Only Four Words Here" in copied.all_text
+    assert copied.lowered["problem_statement"] == "only four words here"
+    assert project.lowered["problem_statement"].startswith("students")
@@ -0,0 +1,81 @@
+import json
+import os
+
+from pydantic import ValidationError
+
+from models.project import HackathonProject
+from models.scoring_engine import ScoringEngine
+
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_projects.json")
+
+
+def load_projects():
+    """The sample submissions, plus copies that vary the scored signals."""
+    projects = []
+    with open(SAMPLES_PATH) as f:
+        for data in json.load(f):
+            try:
+                projects.append(HackathonProject(**data))
+            except ValidationError:
+                continue  # Samples longer than the form allows
+    assert len(projects) >= 2
+    variants = [
+        project.model_copy(update={"demo_link": "https://demo.example.com", "team_size": 1})
+        for project in projects
+    ]
+    variants.append(projects[0].model_copy(update={
+        "solution_description": (
+            "We built a REST API with FastAPI and PostgreSQL, deployed with Docker "
+            "and Kubernetes. A machine learning model trained on historical data "
+            "predicts demand, and a caching layer with Redis keeps latency low. "
+            "Lorem ipsum, insert text here."
+        )
+    }))
+    return projects + variants
+
+
+def test_evaluate_batch_matches_evaluate_project():
+    """Batch and parallel scoring agree field by field with per-project scoring."""
+    engine = ScoringEngine()
+    projects = load_projects()
+    expected = [engine.evaluate_project(p).model_dump() for p in projects]
+
+    batch = [score.model_dump() for score in engine.evaluate_batch(projects)]
+    parallel = [
+        score.model_dump()
+        for score in engine.evaluate_batch_parallel(projects, n_workers=2)
+    ]
+
+    assert len({row["final_score"] for row in expected}) > 1
+    for single, from_batch, from_pool in zip(expected, batch, parallel):
+        for field, value in single.items():
+            assert from_batch[field] == value, field
+            assert from_pool[field] == value, field
+    assert len(batch) == len(parallel) == len(expected)
+    assert engine.evaluate_batch([]) == []
+
+
+def test_weighted_sum_rounds_like_sequential_addition(monkeypatch):
+    """Scores on a .x5 boundary round as the left-to-right weighted sum does."""
+    engine = ScoringEngine()
+    # Criterion scores whose exact weighted sum is 52.95 or 54.15; added left
+    # to right the float result lands just below or above it
+    vectors = [[32, 68, 90, 77, 18, 39, 12], [45, 55, 40, 78, 81, 26, 70]]
+    analyses = iter([
+        ([(float(score), "") for score in vector], (0.0, 0.0, 0.0, 0.0, 0.0), 1.0)
+        for vector in vectors * 2
+    ])
+    monkeypatch.setattr(engine, "_analyze", lambda project: next(analyses))
+    projects = load_projects()[:len(vectors)]
+
+    singles = [engine.evaluate_project(p) for p in projects]
+    batch = engine.evaluate_batch(projects)
+
+    for vector, single, from_batch in zip(vectors, singles, batch):
+        expected = 0.0
+        for score, weight in zip(vector, engine.weights):
+            expected += score * weight
+        assert single.raw_score == from_batch.raw_score == round(expected, 1)
+        assert single.final_score == from_batch.final_score == round(expected, 1)
+    assert [s.raw_score for s in singles] == [52.9, 54.2]
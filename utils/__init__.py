@@ -1,11 +1,28 @@
 # Utils module for AI Hackathon Judge System
-from .nlp_analyzer import NLPAnalyzer, get_text_statistics
+from importlib import import_module
+
 from .validators import (
     ProjectValidator, ValidationError,
     validate_project_data, get_field_help_text, get_field_placeholder
 )
 from .leaderboard import Leaderboard, format_leaderboard_table
 
+# The NLP analyzer is imported on first access, so the app's imports of the
+# validators and leaderboard don't load it or its Aho-Corasick automaton.
+_LAZY_ATTRS = {
+    'NLPAnalyzer': '.nlp_analyzer',
+    'get_text_statistics': '.nlp_analyzer'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'NLPAnalyzer',
     'get_text_statistics',
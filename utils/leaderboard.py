@@ -6,16 +6,52 @@ functionality for evaluating multiple hackathon submissions.
 """
 
 import json
+import math
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import os
-import sys
+import threading
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
 from models.project import ProjectScore
 
+# Log lines holding this key mark a removed row as [project_title, submitted_at]
+_TOMBSTONE_KEY = "_removed"
+
+# Criterion score keys with their display names in winner explanations
+_CRITERIA_LABELS = (
+    ("innovation_score", "Innovation"),
+    ("technical_depth_score", "Technical Depth"),
+    ("problem_relevance_score", "Problem Relevance"),
+    ("feasibility_score", "Feasibility"),
+    ("scalability_score", "Scalability"),
+    ("ui_ux_score", "UI/UX"),
+    ("real_world_impact_score", "Real-World Impact")
+)
+
+# Criterion score keys with the names used in head-to-head comparisons
+_COMPARISON_NAMES = tuple(
+    (key, key.replace("_score", "").replace("_", " ").title()) for key, _ in _CRITERIA_LABELS
+)
+
+# ProjectScore fields copied into each leaderboard row, in row key order
+_SCORE_FIELDS = (
+    ("project_title", "final_score", "raw_score")
+    + tuple(key for key, _ in _CRITERIA_LABELS)
+    + ("total_penalty", "verdict", "verdict_emoji")
+)
+
+# Compact JSON for log lines; the log is read back by code, not people
+_JSON_SEPARATORS = (',', ':')
+
+
+def _rank_key(project: Dict) -> Tuple[float, float]:
+    """Ascending sort key: final score (descending), then raw score for ties."""
+    return (-project["final_score"], -project["raw_score"])
+
 
 class Leaderboard:
     """
@@ -26,20 +62,50 @@ class Leaderboard:
     - Top 3 highlighting
     - Winner explanation
     - Score comparison
-    - Persistence to JSON
+    - Persistence to an append-only JSON Lines log
+    
+    Each submission appends one line to the log and removals append a
+    tombstone, so saving never rewrites the whole board. The log is compacted
+    to just the live rows once it holds more than twice as many lines.
+    
+    Writes are queued and applied in order by a background writer thread,
+    so submissions don't wait on disk I/O. Writes queued back to back are
+    coalesced, with a rewrite superseding everything queued before it. The
+    writer is a non-daemon thread, so pending writes finish before the
+    interpreter exits; call flush() to wait for them explicitly. A write
+    that fails stays queued, and its OSError is raised by the next flush()
+    or change to the board, which retries it.
+    
+    With ``append_mode=False`` the board is instead stored in the older
+    format, a single indented JSON array rewritten on every change.
     """
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: Optional[str] = None, append_mode: bool = True):
         """
         Initialize the leaderboard.
         
         Args:
-            storage_path: Optional path to JSON file for persistence
+            storage_path: Optional path to JSON Lines file for persistence
+            append_mode: Persist as an append-only JSON Lines log (default);
+                False reads and rewrites a whole JSON array file instead
         """
-        self.projects: List[Dict] = []
+        self.projects: List[Dict] = []  # Kept in rank order
+        self._rank_keys: List[Tuple[float, float]] = []  # _rank_key of each row
+        self._by_title: Dict[str, List[Dict]] = {}  # Lowercased title -> rows
         self.storage_path = storage_path
-        
-        if storage_path and os.path.exists(storage_path):
+        self.append_mode = append_mode
+        self._scores_np: Optional[np.ndarray] = None
+        self._log_entries = 0  # Lines in the log, live rows plus tombstones
+        
+        # Queued (kind, payload) writes for the writer thread, where kind is
+        # "append" (one row or tombstone) or "rewrite" (snapshot of live rows)
+        self._pending_writes: List[Tuple[str, object]] = []
+        self._writer_running = False
+        self._write_cond = threading.Condition()
+        # Error from a failed batch, raised by the next flush() or queued write
+        self._write_error: Optional[OSError] = None
+        
+        if storage_path:
             self._load()
     
     def add_project(self, score: ProjectScore) -> int:
@@ -52,35 +118,31 @@ class Leaderboard:
         Returns:
             int: The project's rank (1-indexed)
         """
-        project_data = {
-            "project_title": score.project_title,
-            "final_score": score.final_score,
-            "raw_score": score.raw_score,
-            "innovation_score": score.innovation_score,
-            "technical_depth_score": score.technical_depth_score,
-            "problem_relevance_score": score.problem_relevance_score,
-            "feasibility_score": score.feasibility_score,
-            "scalability_score": score.scalability_score,
-            "ui_ux_score": score.ui_ux_score,
-            "real_world_impact_score": score.real_world_impact_score,
-            "total_penalty": score.total_penalty,
-            "verdict": score.verdict,
-            "verdict_emoji": score.verdict_emoji,
-            "submitted_at": datetime.now().isoformat()
-        }
-        
-        self.projects.append(project_data)
-        self._sort()
+        project_data = {field: getattr(score, field) for field in _SCORE_FIELDS}
+        project_data["submitted_at"] = datetime.now().isoformat()
+        
+        # Insert after any equal scores, as a stable re-sort would
+        key = _rank_key(project_data)
+        pos = bisect_right(self._rank_keys, key)
+        self._rank_keys.insert(pos, key)
+        self.projects.insert(pos, project_data)
+        self._scores_np = None
+        
+        # Rank of the first project with this title
+        title = score.project_title
+        same_title = self._by_title.setdefault(title.lower(), [])
+        earlier = [
+            i for i in map(self._index_of, same_title)
+            if i < pos and self.projects[i]["project_title"] == title
+        ]
+        same_title.append(project_data)
         
+        # Persist last, once the board is consistent; this may raise an
+        # earlier write's error
         if self.storage_path:
-            self._save()
-        
-        # Find and return rank
-        for i, p in enumerate(self.projects):
-            if p["project_title"] == score.project_title:
-                return i + 1
+            self._append_log(project_data)
         
-        return len(self.projects)
+        return min(earlier) + 1 if earlier else pos + 1
     
     def get_rankings(self, limit: Optional[int] = None) -> List[Dict]:
         """
@@ -92,8 +154,6 @@ class Leaderboard:
         Returns:
             List of project data with ranks
         """
-        self._sort()
-        
         rankings = []
         for i, project in enumerate(self.projects[:limit] if limit else self.projects):
             project_with_rank = project.copy()
@@ -122,13 +182,8 @@ class Leaderboard:
         Returns:
             The rank (1-indexed) or None if not found
         """
-        self._sort()
-        
-        for i, project in enumerate(self.projects):
-            if project["project_title"].lower() == project_title.lower():
-                return i + 1
-        
-        return None
+        positions = self._find(project_title)
+        return positions[0] + 1 if positions else None
     
     def explain_winner(self) -> str:
         """
@@ -149,17 +204,10 @@ class Leaderboard:
         score_diff = winner["final_score"] - runner_up["final_score"]
         
         # Find where winner excels
-        criteria = [
-            ("Innovation", winner["innovation_score"], runner_up["innovation_score"]),
-            ("Technical Depth", winner["technical_depth_score"], runner_up["technical_depth_score"]),
-            ("Problem Relevance", winner["problem_relevance_score"], runner_up["problem_relevance_score"]),
-            ("Feasibility", winner["feasibility_score"], runner_up["feasibility_score"]),
-            ("Scalability", winner["scalability_score"], runner_up["scalability_score"]),
-            ("UI/UX", winner["ui_ux_score"], runner_up["ui_ux_score"]),
-            ("Real-World Impact", winner["real_world_impact_score"], runner_up["real_world_impact_score"])
+        advantages = [
+            (name, winner[key] - runner_up[key]) for key, name in _CRITERIA_LABELS
+            if winner[key] > runner_up[key]
         ]
-        
-        advantages = [(name, w - r) for name, w, r in criteria if w > r]
         advantages.sort(key=lambda x: x[1], reverse=True)
         
         if score_diff >= 20:
@@ -193,22 +241,15 @@ class Leaderboard:
         Returns:
             Comparison data dictionary
         """
-        project1 = None
-        project2 = None
-        
-        for p in self.projects:
-            if p["project_title"].lower() == project1_title.lower():
-                project1 = p
-            if p["project_title"].lower() == project2_title.lower():
-                project2 = p
+        # With repeated titles, compare the lowest-ranked entry of each
+        positions1 = self._find(project1_title)
+        positions2 = self._find(project2_title)
         
-        if not project1 or not project2:
+        if not positions1 or not positions2:
             return {"error": "One or both projects not found"}
         
-        criteria = [
-            "innovation_score", "technical_depth_score", "problem_relevance_score",
-            "feasibility_score", "scalability_score", "ui_ux_score", "real_world_impact_score"
-        ]
+        project1 = self.projects[positions1[-1]]
+        project2 = self.projects[positions2[-1]]
         
         comparison = {
             "project1": project1["project_title"],
@@ -220,8 +261,7 @@ class Leaderboard:
             "criteria_comparison": {}
         }
         
-        for criterion in criteria:
-            criterion_name = criterion.replace("_score", "").replace("_", " ").title()
+        for criterion, criterion_name in _COMPARISON_NAMES:
             comparison["criteria_comparison"][criterion_name] = {
                 "project1": project1[criterion],
                 "project2": project2[criterion],
@@ -246,23 +286,33 @@ class Leaderboard:
                 "score_range": 0
             }
         
-        scores = [p["final_score"] for p in self.projects]
+        # Rows are kept in rank order, so the extremes sit at the ends and
+        # each verdict bucket boundary is a single bisect on the rank keys
+        total = len(self.projects)
+        highest = float(self.projects[0]["final_score"])
+        lowest = float(self.projects[-1]["final_score"])
+        at_least_85, at_least_70, at_least_50 = (
+            bisect_right(self._rank_keys, (-threshold, math.inf)) for threshold in (85, 70, 50)
+        )
         
         return {
-            "total_projects": len(self.projects),
-            "average_score": round(sum(scores) / len(scores), 1),
-            "highest_score": max(scores),
-            "lowest_score": min(scores),
-            "score_range": max(scores) - min(scores),
-            "winner_material_count": sum(1 for p in self.projects if p["final_score"] >= 85),
-            "strong_contender_count": sum(1 for p in self.projects if 70 <= p["final_score"] < 85),
-            "average_count": sum(1 for p in self.projects if 50 <= p["final_score"] < 70),
-            "not_ready_count": sum(1 for p in self.projects if p["final_score"] < 50)
+            "total_projects": total,
+            "average_score": round(float(self._score_array().mean()), 1),
+            "highest_score": highest,
+            "lowest_score": lowest,
+            "score_range": highest - lowest,
+            "winner_material_count": at_least_85,
+            "strong_contender_count": at_least_70 - at_least_85,
+            "average_count": at_least_50 - at_least_70,
+            "not_ready_count": total - at_least_50
         }
     
     def clear(self):
         """Clear all projects from the leaderboard."""
         self.projects = []
+        self._rank_keys = []
+        self._by_title = {}
+        self._scores_np = None
         if self.storage_path:
             self._save()
     
@@ -276,43 +326,278 @@ class Leaderboard:
         Returns:
             True if removed, False if not found
         """
-        for i, p in enumerate(self.projects):
-            if p["project_title"].lower() == project_title.lower():
-                self.projects.pop(i)
-                if self.storage_path:
-                    self._save()
-                return True
+        title_key = project_title.lower()
+        same_title = self._by_title.get(title_key)
+        if not same_title:
+            return False
+        
+        # Best-ranked row with this title
+        i = min(map(self._index_of, same_title))
+        p = self.projects.pop(i)
+        self._rank_keys.pop(i)
+        same_title[:] = [row for row in same_title if row is not p]
+        if not same_title:
+            del self._by_title[title_key]
+        self._scores_np = None
         
-        return False
+        if self.storage_path:
+            self._append_log({_TOMBSTONE_KEY: [p["project_title"], p["submitted_at"]]})
+            self._maybe_compact()
+        return True
+    
+    def _score_array(self) -> np.ndarray:
+        """Get final scores as a NumPy array, rebuilt only after the board changes."""
+        if self._scores_np is None:
+            self._scores_np = np.fromiter(
+                (p["final_score"] for p in self.projects),
+                dtype=np.float64,
+                count=len(self.projects)
+            )
+        return self._scores_np
     
     def _sort(self):
-        """Sort projects by final score (descending), then by raw score for ties."""
-        self.projects.sort(
-            key=lambda x: (x["final_score"], x["raw_score"]),
-            reverse=True
-        )
+        """
+        Sort projects by final score (descending), then by raw score for ties,
+        and rebuild the rank keys and title index to match.
+        """
+        self.projects.sort(key=_rank_key)
+        self._rank_keys = [_rank_key(p) for p in self.projects]
+        self._by_title = {}
+        for p in self.projects:
+            self._by_title.setdefault(p["project_title"].lower(), []).append(p)
+    
+    def _index_of(self, project: Dict) -> int:
+        """Position of a stored row, found by bisecting on its rank key."""
+        i = bisect_left(self._rank_keys, _rank_key(project))
+        while self.projects[i] is not project:
+            i += 1  # Step past other rows with the same scores
+        return i
+    
+    def _find(self, project_title: str) -> List[int]:
+        """Positions, in rank order, of the rows titled project_title (any case)."""
+        return sorted(map(self._index_of, self._by_title.get(project_title.lower(), ())))
+    
+    def flush(self):
+        """
+        Block until every queued write has reached the log.
+        
+        Raises:
+            OSError: If a write failed. The failed writes stay queued and are
+                retried by the next flush or write.
+        """
+        with self._write_cond:
+            if self._pending_writes and not self._writer_running:
+                self._start_writer()  # Retry writes left by a failed batch
+            self._write_cond.wait_for(lambda: not self._writer_running)
+            self._raise_write_error()
+    
+    def _append_log(self, entry: Dict):
+        """Queue one row or tombstone to be appended to the JSON Lines log."""
+        if not self.append_mode:
+            self._save()  # The array file has no log; rewrite the live rows
+            return
+        self._log_entries += 1
+        self._queue_write("append", entry)
+    
+    def _maybe_compact(self):
+        """Compact the log once dead lines outnumber the live rows."""
+        if self._log_entries > 2 * len(self.projects):
+            self._save()
     
     def _save(self):
-        """Save leaderboard to JSON file."""
+        """Rewrite the log with only the live rows."""
         if not self.storage_path:
             return
         
+        self._log_entries = len(self.projects)
+        self._queue_write("rewrite", list(self.projects))
+    
+    def _queue_write(self, kind: str, payload: object):
+        """
+        Queue a write, starting the writer thread if it isn't running.
+        
+        Raises:
+            OSError: If an earlier write failed. This write is still queued,
+                and the writer is restarting to retry both.
+        """
+        with self._write_cond:
+            self._pending_writes.append((kind, payload))
+            if not self._writer_running:
+                self._start_writer()
+            self._raise_write_error()
+    
+    def _start_writer(self):
+        """Start the writer thread; the caller holds ``_write_cond``."""
+        self._writer_running = True
+        threading.Thread(target=self._drain_writes, name="leaderboard-writer").start()
+    
+    def _raise_write_error(self):
+        """Raise and clear the stored writer error; the caller holds ``_write_cond``."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+    
+    def _drain_writes(self):
+        """Writer thread: apply queued writes until the queue is empty."""
+        try:
+            while True:
+                with self._write_cond:
+                    writes, self._pending_writes = self._pending_writes, []
+                    if not writes:
+                        # Stop under the lock, so a write queued from now on
+                        # starts a new writer
+                        self._writer_running = False
+                        self._write_cond.notify_all()
+                        return
+                try:
+                    self._apply_writes(writes)
+                except OSError as e:
+                    # Keep the batch, ahead of writes queued since, and stop;
+                    # the next flush or write reports the error and retries
+                    with self._write_cond:
+                        self._pending_writes[:0] = writes
+                        self._write_error = e
+                        self._writer_running = False
+                        self._write_cond.notify_all()
+                    return
+        except BaseException:
+            with self._write_cond:
+                self._writer_running = False
+                self._write_cond.notify_all()
+            raise
+    
+    def _apply_writes(self, writes: List[Tuple[str, object]]):
+        """Write one batch of queued writes, in order, to the log."""
         os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
         
-        with open(self.storage_path, 'w') as f:
-            json.dump(self.projects, f, indent=2)
+        # Only the last rewrite matters; it already holds every earlier row
+        rewrites = [i for i, (kind, _) in enumerate(writes) if kind == "rewrite"]
+        if rewrites:
+            # Write a sibling file and swap it in, so a crash never leaves a
+            # half-written log behind
+            tmp_path = self.storage_path + ".tmp"
+            rows = writes[rewrites[-1]][1]
+            with open(tmp_path, 'w') as f:
+                if self.append_mode:
+                    f.writelines(json.dumps(p, separators=_JSON_SEPARATORS) + "\n" for p in rows)
+                else:
+                    json.dump(rows, f, indent=2)
+            os.replace(tmp_path, self.storage_path)
+            writes = writes[rewrites[-1] + 1:]
+        
+        if writes:
+            with open(self.storage_path, 'a') as f:
+                f.writelines(
+                    json.dumps(entry, separators=_JSON_SEPARATORS) + "\n"
+                    for _, entry in writes
+                )
     
     def _load(self):
-        """Load leaderboard from JSON file."""
-        if not self.storage_path or not os.path.exists(self.storage_path):
+        """Load leaderboard by replaying the JSON Lines log."""
+        if not self.storage_path:
             return
         
+        if not os.path.exists(self.storage_path):
+            if self.append_mode:
+                self._upgrade_array_file()
+            return
+        
+        if not self.append_mode:
+            self._load_array()
+            return
+        
+        projects, removed, entries = self._read_log()
+        if removed:
+            projects = self._drop_tombstoned(projects, removed)
+        
+        self.projects = projects
+        self._log_entries = entries
+        self._sort()
+        self._scores_np = None
+        self._maybe_compact()
+    
+    def _read_log(self) -> Tuple[List[Dict], Counter, int]:
+        """
+        Read every complete line of the JSON Lines log.
+        
+        Returns:
+            Tuple of (rows in log order, tombstone count per
+            (project_title, submitted_at), number of lines read)
+        """
+        projects = []
+        removed = Counter()
+        entries = 0
         try:
             with open(self.storage_path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # e.g. a line cut short by a crash mid-write
+                    entries += 1
+                    if _TOMBSTONE_KEY in entry:
+                        removed[tuple(entry[_TOMBSTONE_KEY])] += 1
+                    else:
+                        projects.append(entry)
+        except IOError:
+            return [], Counter(), 0
+        return projects, removed, entries
+    
+    @staticmethod
+    def _drop_tombstoned(projects: List[Dict], removed: Counter) -> List[Dict]:
+        """Drop one row per tombstone, matching on title and submission time."""
+        live = []
+        for p in projects:
+            key = (p["project_title"], p["submitted_at"])
+            if removed[key]:
+                removed[key] -= 1
+            else:
+                live.append(p)
+        return live
+    
+    def _upgrade_array_file(self):
+        """
+        Import a board saved in the older JSON array format.
+        
+        Before the log, boards were stored as ``<stem>.json``. If that file
+        exists while ``<stem>.jsonl`` doesn't, its rows become the first
+        compacted log. The old file is left in place.
+        """
+        array_path = os.path.splitext(self.storage_path)[0] + ".json"
+        if array_path == self.storage_path or not os.path.exists(array_path):
+            return
+        
+        self._load_array(array_path)
+        if self.projects:
+            self._save()
+    
+    def _load_array(self, path: Optional[str] = None):
+        """
+        Load leaderboard from a JSON array file (``append_mode=False``).
+        
+        Args:
+            path: File to read; defaults to the storage path
+        """
+        try:
+            with open(path or self.storage_path, 'r') as f:
                 self.projects = json.load(f)
-            self._sort()
         except (json.JSONDecodeError, IOError):
             self.projects = []
+        self._log_entries = len(self.projects)
+        self._sort()
+        self._scores_np = None
+
+
+# Fixed parts of the text table. Rows truncate the title to 38 characters
+# padded to 40, and the verdict to 13, in the format spec itself
+_TABLE_TOP = "┌" + "─" * 6 + "┬" + "─" * 40 + "┬" + "─" * 8 + "┬" + "─" * 18 + "┐"
+_TABLE_HEADER = "│ Rank │ Project" + " " * 32 + "│ Score  │ Verdict          │"
+_TABLE_DIVIDER = "├" + "─" * 6 + "┼" + "─" * 40 + "┼" + "─" * 8 + "┼" + "─" * 18 + "┤"
+_TABLE_BOTTOM = "└" + "─" * 6 + "┴" + "─" * 40 + "┴" + "─" * 8 + "┴" + "─" * 18 + "┘"
+_TABLE_ROW = "│{}│ {:<40.38}│{:>6.1f} │ {} {:<13.13}│"
+_MEDAL_CELLS = ("  🥇   ", "  🥈   ", "  🥉   ")
 
 
 def format_leaderboard_table(rankings: List[Dict]) -> str:
@@ -328,23 +613,12 @@ def format_leaderboard_table(rankings: List[Dict]) -> str:
     if not rankings:
         return "No projects submitted yet."
     
-    lines = []
-    lines.append("┌" + "─" * 6 + "┬" + "─" * 40 + "┬" + "─" * 8 + "┬" + "─" * 18 + "┐")
-    lines.append("│ Rank │ Project" + " " * 32 + "│ Score  │ Verdict          │")
-    lines.append("├" + "─" * 6 + "┼" + "─" * 40 + "┼" + "─" * 8 + "┼" + "─" * 18 + "┤")
-    
+    lines = [_TABLE_TOP, _TABLE_HEADER, _TABLE_DIVIDER]
     for r in rankings:
-        rank_str = f"{r['rank']:^6}"
-        title = r["project_title"][:38].ljust(40)
-        score = f"{r['final_score']:>6.1f} "
-        verdict = f"{r['verdict_emoji']} {r['verdict'][:13]:<13}"
-        
-        if r["is_top_3"]:
-            medal = ["🥇", "🥈", "🥉"][r["rank"] - 1]
-            rank_str = f"  {medal}   "
-        
-        lines.append(f"│{rank_str}│ {title}│{score}│ {verdict}│")
-    
-    lines.append("└" + "─" * 6 + "┴" + "─" * 40 + "┴" + "─" * 8 + "┴" + "─" * 18 + "┘")
+        rank_cell = _MEDAL_CELLS[r["rank"] - 1] if r["is_top_3"] else f"{r['rank']:^6}"
+        lines.append(_TABLE_ROW.format(
+            rank_cell, r["project_title"], r["final_score"], r["verdict_emoji"], r["verdict"]
+        ))
+    lines.append(_TABLE_BOTTOM)
     
     return "\n".join(lines)
@@ -6,10 +6,95 @@ including TF-IDF analysis, semantic coherence checking, and substance detection.
 """
 
 import re
-from typing import Dict, List, Tuple, Set
+from typing import Dict, FrozenSet, List, Tuple
 from collections import Counter
+import heapq
 import math
 
+import ahocorasick
+import numpy as np
+
+
+# Words of three or more characters: the same tokens as replacing
+# punctuation with spaces, splitting, and dropping words of two characters
+_WORD_RE = re.compile(r'\w{3,}')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+# Common English stop words, dropped by the tokenizer
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "need", "dare", "ought",
+    "used", "it", "its", "this", "that", "these", "those", "i", "we", "you",
+    "he", "she", "they", "me", "us", "him", "her", "them", "my", "our", "your",
+    "his", "their", "what", "which", "who", "whom", "whose", "when", "where",
+    "why", "how", "all", "each", "every", "both", "few", "more", "most", "other",
+    "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than",
+    "too", "very", "just", "also", "now", "here", "there", "then", "once"
+})
+
+# Common technical terms that indicate substance
+_TECHNICAL_TERMS = frozenset({
+    "algorithm", "api", "architecture", "authentication", "authorization",
+    "backend", "frontend", "database", "cache", "server", "client",
+    "framework", "library", "module", "component", "service", "microservice",
+    "container", "docker", "kubernetes", "deployment", "ci/cd", "pipeline",
+    "testing", "unit", "integration", "e2e", "performance", "optimization",
+    "security", "encryption", "protocol", "http", "rest", "graphql", "websocket",
+    "machine learning", "neural", "model", "training", "inference", "dataset",
+    "preprocessing", "feature", "classification", "regression", "clustering",
+    "validation", "cross-validation", "accuracy", "precision", "recall",
+    "react", "vue", "angular", "node", "python", "javascript", "typescript",
+    "sql", "nosql", "mongodb", "postgresql", "redis", "elasticsearch",
+    "aws", "gcp", "azure", "cloud", "serverless", "lambda", "function"
+})
+
+# Placeholder patterns and generic template phrases flagged by detect_copy_paste
+_PLACEHOLDERS = (
+    "[insert", "[your", "[project name]", "lorem ipsum",
+    "xxx", "todo", "tbd", "placeholder", "[description]",
+    "example.com", "sample text", "your company"
+)
+_TEMPLATE_PHRASES = (
+    "our innovative solution", "cutting-edge technology",
+    "revolutionize the industry", "game-changing approach",
+    "state-of-the-art", "best-in-class", "world-class",
+    "leveraging the power of", "harnessing the potential"
+)
+
+# Known technologies by category, checked by analyze_tech_stack (tuples, as
+# the table is shared by every analyzer and must not be modified)
+_TECH_STACK_CATEGORIES = {
+    "frontend": ("react", "vue", "angular", "svelte", "next.js", "nuxt", "html", "css", "tailwind"),
+    "backend": ("node", "express", "django", "flask", "fastapi", "spring", "rails", "nest"),
+    "database": ("postgresql", "mysql", "mongodb", "redis", "firebase", "supabase", "sqlite"),
+    "ml_ai": ("tensorflow", "pytorch", "sklearn", "keras", "openai", "langchain", "huggingface"),
+    "cloud": ("aws", "gcp", "azure", "vercel", "netlify", "heroku", "docker", "kubernetes"),
+    "mobile": ("react native", "flutter", "swift", "kotlin", "expo")
+}
+
+
+def _build_tech_automaton() -> ahocorasick.Automaton:
+    """
+    Compile every known technology into one Aho-Corasick automaton.
+    
+    Each tech maps to (position, category, tech), where position is its
+    place in _TECH_STACK_CATEGORIES, so sorted matches come out grouped by
+    category in the listed order.
+    """
+    automaton = ahocorasick.Automaton()
+    position = 0
+    for category, techs in _TECH_STACK_CATEGORIES.items():
+        for tech in techs:
+            automaton.add_word(tech, (position, category, tech))
+            position += 1
+    automaton.make_automaton()
+    return automaton
+
+
+_TECH_STACK_AUTOMATON = _build_tech_automaton()
+
 
 class NLPAnalyzer:
     """
@@ -28,37 +113,13 @@ class NLPAnalyzer:
         self.stop_words = self._get_stop_words()
         self.technical_terms = self._get_technical_terms()
     
-    def _get_stop_words(self) -> Set[str]:
+    def _get_stop_words(self) -> FrozenSet[str]:
         """Get common English stop words."""
-        return {
-            "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-            "be", "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "shall", "can", "need", "dare", "ought",
-            "used", "it", "its", "this", "that", "these", "those", "i", "we", "you",
-            "he", "she", "they", "me", "us", "him", "her", "them", "my", "our", "your",
-            "his", "their", "what", "which", "who", "whom", "whose", "when", "where",
-            "why", "how", "all", "each", "every", "both", "few", "more", "most", "other",
-            "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than",
-            "too", "very", "just", "also", "now", "here", "there", "then", "once"
-        }
+        return _STOP_WORDS
     
-    def _get_technical_terms(self) -> Set[str]:
+    def _get_technical_terms(self) -> FrozenSet[str]:
         """Get common technical terms that indicate substance."""
-        return {
-            "algorithm", "api", "architecture", "authentication", "authorization",
-            "backend", "frontend", "database", "cache", "server", "client",
-            "framework", "library", "module", "component", "service", "microservice",
-            "container", "docker", "kubernetes", "deployment", "ci/cd", "pipeline",
-            "testing", "unit", "integration", "e2e", "performance", "optimization",
-            "security", "encryption", "protocol", "http", "rest", "graphql", "websocket",
-            "machine learning", "neural", "model", "training", "inference", "dataset",
-            "preprocessing", "feature", "classification", "regression", "clustering",
-            "validation", "cross-validation", "accuracy", "precision", "recall",
-            "react", "vue", "angular", "node", "python", "javascript", "typescript",
-            "sql", "nosql", "mongodb", "postgresql", "redis", "elasticsearch",
-            "aws", "gcp", "azure", "cloud", "serverless", "lambda", "function"
-        }
+        return _TECHNICAL_TERMS
     
     def analyze_text(self, text: str) -> Dict:
         """
@@ -70,8 +131,72 @@ class NLPAnalyzer:
         Returns:
             Dict: Analysis results including statistics and scores
         """
+        return self._analyze_words(text, self._tokenize(text))
+    
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze several texts, ranking key concepts by TF-IDF over the batch.
+        
+        Each result has the same fields as analyze_text, except that
+        ``key_concepts`` holds the text's top 10 terms by TF-IDF weight
+        across all the texts, so words every submission uses rank below
+        the ones that set a text apart. The term-document matrix is built
+        once for the whole batch by scikit-learn.
+        
+        Args:
+            texts: The texts to analyze
+            
+        Returns:
+            List[Dict]: One analysis per text, in input order
+        """
+        # Imported here so importing utils stays cheap when batches aren't used
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        token_lists = [self._tokenize(text) for text in texts]
+        results = [self._analyze_words(text, words) for text, words in zip(texts, token_lists)]
+        if not any(token_lists):
+            return results  # No terms to weight
+        
+        # The documents are already token lists, so the analyzer only copies them
+        vectorizer = TfidfVectorizer(analyzer=list)
+        tfidf = vectorizer.fit_transform(token_lists)
+        tfidf.sort_indices()
+        vocabulary = vectorizer.get_feature_names_out()
+        
+        for i, result in enumerate(results):
+            start, end = tfidf.indptr[i], tfidf.indptr[i + 1]
+            weights = tfidf.data[start:end]
+            # Highest weight first; ties keep alphabetical order
+            top = np.argsort(-weights, kind="stable")[:10]
+            result["key_concepts"] = vocabulary[tfidf.indices[start:end][top]].tolist()
+        
+        return results
+    
+    def analyze_submission(self, text: str, tech_stack: str) -> Dict:
+        """
+        Run the text, copy-paste and tech stack analyses for one submission.
+        
+        The text is lowercased once and shared by the tokenizer and the
+        copy-paste check, instead of once by each.
+        
+        Args:
+            text: The submission's combined text
+            tech_stack: The tech stack string
+            
+        Returns:
+            Dict: ``text`` (analyze_text), ``copy_paste`` (detect_copy_paste)
+            and ``tech_stack`` (analyze_tech_stack) results
+        """
+        text_lower = text.lower()
+        return {
+            "text": self._analyze_words(text, self._tokenize_lower(text_lower)),
+            "copy_paste": self._detect_copy_paste_lower(text_lower),
+            "tech_stack": self.analyze_tech_stack(tech_stack)
+        }
+    
+    def _analyze_words(self, text: str, words: List[str]) -> Dict:
+        """Compute the analyze_text metrics for text and its tokens."""
         # Basic statistics
-        words = self._tokenize(text)
         sentences = self._split_sentences(text)
         
         # Calculate metrics
@@ -79,13 +204,16 @@ class NLPAnalyzer:
         sentence_count = len(sentences)
         avg_sentence_length = word_count / max(1, sentence_count)
         
+        # Word frequencies, counted once and shared by the metrics below
+        word_freq = Counter(words)
+        
         # Vocabulary richness
-        unique_words = set(words)
-        vocabulary_richness = len(unique_words) / max(1, word_count)
+        vocabulary_richness = len(word_freq) / max(1, word_count)
         
-        # Technical content ratio
-        technical_words = [w for w in words if w.lower() in self.technical_terms]
-        technical_ratio = len(technical_words) / max(1, word_count)
+        # Technical content ratio (tokens are already lowercased)
+        technical_terms = self.technical_terms
+        technical_count = sum(freq for w, freq in word_freq.items() if w in technical_terms)
+        technical_ratio = technical_count / max(1, word_count)
         
         # Substance score (higher = more substantive)
         substance_score = self._calculate_substance_score(
@@ -96,7 +224,7 @@ class NLPAnalyzer:
         readability_score = self._calculate_readability(words, sentences)
         
         # Key concepts using TF-IDF-like approach
-        key_concepts = self._extract_key_concepts(words)
+        key_concepts = self._extract_key_concepts(word_freq)
         
         return {
             "word_count": word_count,
@@ -111,16 +239,17 @@ class NLPAnalyzer:
     
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into words."""
-        # Remove punctuation and split
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = text.split()
-        # Filter out stop words and very short words
-        words = [w for w in words if w not in self.stop_words and len(w) > 2]
-        return words
+        return self._tokenize_lower(text.lower())
+    
+    def _tokenize_lower(self, text_lower: str) -> List[str]:
+        """Tokenize already-lowercased text into words."""
+        # One pass over the text; short words never match _WORD_RE
+        stop_words = self.stop_words
+        return [w for w in _WORD_RE.findall(text_lower) if w not in stop_words]
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_END_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences
     
@@ -173,7 +302,7 @@ class NLPAnalyzer:
         if not words or not sentences:
             return 50
         
-        avg_word_length = sum(len(w) for w in words) / len(words)
+        avg_word_length = sum(map(len, words)) / len(words)
         avg_sent_length = len(words) / len(sentences)
         
         # Simplified readability: penalize long words and long sentences
@@ -181,25 +310,25 @@ class NLPAnalyzer:
         
         return max(0, min(100, score))
     
-    def _extract_key_concepts(self, words: List[str]) -> List[str]:
+    def _extract_key_concepts(self, word_freq: Counter) -> List[str]:
         """
         Extract key concepts using term frequency.
         
         Uses a TF-IDF-like approach to find important terms.
-        """
-        # Count word frequencies
-        word_freq = Counter(words)
         
+        Args:
+            word_freq: Frequency of each token, as counted by analyze_text
+        """
         # Filter to meaningful words (appear at least twice or are technical)
         meaningful = {
             word: freq for word, freq in word_freq.items()
             if freq >= 2 or word in self.technical_terms
         }
         
-        # Sort by frequency
-        sorted_words = sorted(meaningful.items(), key=lambda x: x[1], reverse=True)
+        # Top 10 by frequency; ties keep first-seen order, as a stable sort would
+        top_words = heapq.nlargest(10, meaningful.items(), key=lambda x: x[1])
         
-        return [word for word, freq in sorted_words[:10]]
+        return [word for word, freq in top_words]
     
     def check_coherence(self, problem: str, solution: str, innovation: str) -> Dict:
         """
@@ -218,15 +347,20 @@ class NLPAnalyzer:
         solution_words = set(self._tokenize(solution))
         innovation_words = set(self._tokenize(innovation))
         
-        # Calculate overlaps (measure of coherence)
-        prob_sol_overlap = len(problem_words & solution_words) / max(1, len(problem_words | solution_words))
-        sol_innov_overlap = len(solution_words & innovation_words) / max(1, len(solution_words | innovation_words))
+        # Calculate overlaps (measure of coherence); |A | B| = |A| + |B| - |A & B|,
+        # so the unions never need to be built
+        prob_sol_shared = problem_words & solution_words
+        prob_sol_union = len(problem_words) + len(solution_words) - len(prob_sol_shared)
+        prob_sol_overlap = len(prob_sol_shared) / max(1, prob_sol_union)
+        sol_innov_shared = len(solution_words & innovation_words)
+        sol_innov_union = len(solution_words) + len(innovation_words) - sol_innov_shared
+        sol_innov_overlap = sol_innov_shared / max(1, sol_innov_union)
         
         # Coherence score
         coherence_score = ((prob_sol_overlap + sol_innov_overlap) / 2) * 100
         
         # Identify shared concepts
-        all_shared = problem_words & solution_words & innovation_words
+        all_shared = prob_sol_shared & innovation_words
         
         return {
             "problem_solution_coherence": round(prob_sol_overlap * 100, 1),
@@ -245,24 +379,15 @@ class NLPAnalyzer:
         - Generic template phrases
         - Inconsistent formatting
         """
-        text_lower = text.lower()
-        
+        return self._detect_copy_paste_lower(text.lower())
+    
+    def _detect_copy_paste_lower(self, text_lower: str) -> Dict:
+        """detect_copy_paste for already-lowercased text."""
         # Check for placeholder patterns
-        placeholders = [
-            "[insert", "[your", "[project name]", "lorem ipsum",
-            "xxx", "todo", "tbd", "placeholder", "[description]",
-            "example.com", "sample text", "your company"
-        ]
-        placeholder_count = sum(1 for p in placeholders if p in text_lower)
+        placeholder_count = sum(1 for p in _PLACEHOLDERS if p in text_lower)
         
         # Check for template phrases
-        templates = [
-            "our innovative solution", "cutting-edge technology",
-            "revolutionize the industry", "game-changing approach",
-            "state-of-the-art", "best-in-class", "world-class",
-            "leveraging the power of", "harnessing the potential"
-        ]
-        template_count = sum(1 for t in templates if t in text_lower)
+        template_count = sum(1 for t in _TEMPLATE_PHRASES if t in text_lower)
         
         # Calculate copy-paste score
         copy_paste_score = min(100, (placeholder_count * 20) + (template_count * 10))
@@ -286,21 +411,13 @@ class NLPAnalyzer:
         """
         tech_lower = tech_stack.lower()
         
-        # Known technologies by category
-        categories = {
-            "frontend": ["react", "vue", "angular", "svelte", "next.js", "nuxt", "html", "css", "tailwind"],
-            "backend": ["node", "express", "django", "flask", "fastapi", "spring", "rails", "nest"],
-            "database": ["postgresql", "mysql", "mongodb", "redis", "firebase", "supabase", "sqlite"],
-            "ml_ai": ["tensorflow", "pytorch", "sklearn", "keras", "openai", "langchain", "huggingface"],
-            "cloud": ["aws", "gcp", "azure", "vercel", "netlify", "heroku", "docker", "kubernetes"],
-            "mobile": ["react native", "flutter", "swift", "kotlin", "expo"]
-        }
+        # Find every known technology in one pass (each counted once, even
+        # if repeated or inside another, e.g. "react" in "react native")
+        found = {match for _, match in _TECH_STACK_AUTOMATON.iter(tech_lower)}
         
         detected = {}
-        for category, techs in categories.items():
-            found = [tech for tech in techs if tech in tech_lower]
-            if found:
-                detected[category] = found
+        for _, category, tech in sorted(found):
+            detected.setdefault(category, []).append(tech)
         
         # Count total technologies
         total_techs = sum(len(techs) for techs in detected.values())
@@ -331,7 +448,7 @@ def get_text_statistics(text: str) -> Dict:
         Dict: Basic statistics
     """
     words = text.split()
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_END_RE.split(text)
     sentences = [s for s in sentences if s.strip()]
     
     return {
@@ -3,15 +3,65 @@ AI Hackathon Judge System - Input Validators
 
 This module provides comprehensive input validation and cleaning
 for hackathon project submissions.
+
+Performance: inputs are a handful of form fields under 3,000 characters,
+so the cost is interpreter dispatch around C-level string and regex
+calls, not computation. Speedups come from precompiled patterns, fast
+paths that skip passes on clean input, precomputed tables and cached URL
+checks; SIMD, GPU or Numba kernels do not apply (Numba cannot run ``re``).
 """
 
 import re
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Tuple, List
+
+
+# Patterns used by the URL checks and text cleaning, compiled once at import
+_GITHUB_RE = re.compile(r'^https?://(?:www\.)?github\.com/[\w\-]+/[\w\-\.]+/?.*$')
+_URL_RE = re.compile(r'^https?://[^\s<>"{}|\\^`\[\]]+$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_CTRL_CHAR_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# The control characters _CTRL_CHAR_RE matches within ASCII, as bytes to delete
+_CTRL_BYTES = bytes(range(0x00, 0x20)) + b'\x7f'
+
+
+def _build_length_checks(limits: dict) -> Tuple[tuple, ...]:
+    """Precompute each field's limits and error messages, in field order."""
+    checks = []
+    for field, (min_len, max_len) in limits.items():
+        name = field.replace("_", " ").title()
+        checks.append((
+            field, min_len, max_len,
+            f"{name} is required",
+            f"{name} must be at least {min_len} characters",
+            f"{name} must be at most {max_len} characters"
+        ))
+    return tuple(checks)
+
+
+# Resubmissions and re-validation repeat the same links, so results are cached
+@lru_cache(maxsize=1024)
+def _is_valid_github_url(url: str) -> bool:
+    """Check if URL is a valid GitHub repository link."""
+    url = url.strip().lower()
+    # Every match contains this, and the substring scan rejects faster
+    if 'github.com/' not in url:
+        return False
+    return _GITHUB_RE.match(url) is not None
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_url(url: str) -> bool:
+    """Check if URL is valid."""
+    return _URL_RE.match(url.strip()) is not None
 
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     
+    __slots__ = ('field', 'message')
+    
     def __init__(self, field: str, message: str):
         self.field = field
         self.message = message
@@ -29,6 +79,9 @@ class ProjectValidator:
     - Content quality
     """
     
+    # No per-instance state; limits and names live on the class
+    __slots__ = ()
+    
     # Field length limits
     LIMITS = {
         "project_title": (3, 100),
@@ -40,6 +93,9 @@ class ProjectValidator:
         "future_scope": (50, 1000)
     }
     
+    # (field, min, max, required/too short/too long messages) per limit
+    _LENGTH_CHECKS = _build_length_checks(LIMITS)
+    
     def __init__(self):
         """Initialize the validator."""
         pass
@@ -54,18 +110,69 @@ class ProjectValidator:
         Returns:
             Tuple of (is_valid, list of error messages)
         """
+        lengths = {}
+        for field in self.LIMITS:
+            value = data.get(field, "")
+            lengths[field] = len(value.strip()) if value else 0
+        
+        return self._validate(data, lengths)
+    
+    def clean_and_validate(self, data: dict) -> Tuple[bool, List[str], dict]:
+        """
+        Clean submission data and validate the cleaned values.
+        
+        Text fields are measured as they are cleaned (clean_text already
+        strips), so validation doesn't re-read and re-strip them.
+        
+        Args:
+            data: Raw form data dictionary
+            
+        Returns:
+            Tuple of (is_valid, errors, cleaned_data)
+        """
+        cleaned = {}
+        lengths = {}
+        for key, value in data.items():
+            if key == "team_size":
+                try:
+                    cleaned[key] = int(value) if value else None
+                except (ValueError, TypeError):
+                    cleaned[key] = None
+                continue
+            
+            # Form values are already strings; only convert anything else
+            if not isinstance(value, str):
+                value = str(value) if value else ""
+            if key in ("github_link", "demo_link"):
+                cleaned[key] = self.clean_url(value)
+            else:
+                text = self.clean_text(value)
+                cleaned[key] = text
+                lengths[key] = len(text)
+        
+        is_valid, errors = self._validate(cleaned, lengths)
+        return is_valid, errors, cleaned
+    
+    def _validate(self, data: dict, lengths: dict) -> Tuple[bool, List[str]]:
+        """Validate data given the stripped length of each limited text field."""
         errors = []
         
         # Validate required text fields
-        for field, (min_len, max_len) in self.LIMITS.items():
-            value = data.get(field, "")
-            if not value or not value.strip():
-                errors.append(f"{self._format_field_name(field)} is required")
-            elif len(value.strip()) < min_len:
-                errors.append(f"{self._format_field_name(field)} must be at least {min_len} characters")
-            elif len(value.strip()) > max_len:
-                errors.append(f"{self._format_field_name(field)} must be at most {max_len} characters")
+        for field, min_len, max_len, required, too_short, too_long in self._LENGTH_CHECKS:
+            length = lengths.get(field, 0)
+            if not length:
+                errors.append(required)
+            elif length < min_len:
+                errors.append(too_short)
+            elif length > max_len:
+                errors.append(too_long)
         
+        self._validate_team_and_links(data, errors)
+        
+        return len(errors) == 0, errors
+    
+    def _validate_team_and_links(self, data: dict, errors: List[str]) -> None:
+        """Append errors for the team size, GitHub link and demo link."""
         # Validate team size
         team_size = data.get("team_size")
         if team_size is None:
@@ -85,29 +192,14 @@ class ProjectValidator:
         if demo_link and demo_link.strip():
             if not self._is_valid_url(demo_link):
                 errors.append("Demo link must be a valid URL")
-        
-        return len(errors) == 0, errors
-    
-    def _format_field_name(self, field: str) -> str:
-        """Convert field name to human-readable format."""
-        return field.replace("_", " ").title()
     
     def _is_valid_github_url(self, url: str) -> bool:
         """Check if URL is a valid GitHub repository link."""
-        url = url.strip().lower()
-        
-        patterns = [
-            r'^https?://github\.com/[\w\-]+/[\w\-\.]+/?.*$',
-            r'^https?://www\.github\.com/[\w\-]+/[\w\-\.]+/?.*$',
-        ]
-        
-        return any(re.match(pattern, url) for pattern in patterns)
+        return _is_valid_github_url(url)
     
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid."""
-        url = url.strip()
-        pattern = r'^https?://[^\s<>"{}|\\^`\[\]]+$'
-        return bool(re.match(pattern, url))
+        return _is_valid_url(url)
     
     def clean_text(self, text: str) -> str:
         """
@@ -122,14 +214,23 @@ class ProjectValidator:
         if not text:
             return ""
         
-        # Remove extra whitespace
+        # Printable text has no control characters or whitespace besides ' ',
+        # so without tags or double spaces only the ends need trimming
+        if text.isprintable() and '<' not in text and '  ' not in text:
+            return text.strip()
+        
+        # Remove extra whitespace; split/join beats a compiled \s+ sub here
         text = ' '.join(text.split())
         
         # Remove potentially harmful HTML/script tags
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         
-        # Remove control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        # Remove control characters; a bytes pass is only possible on ASCII
+        if text.isascii():
+            text = text.encode('ascii').translate(None, _CTRL_BYTES).decode('ascii')
+        else:
+            text = _CTRL_CHAR_RE.sub('', text)
         
         return text.strip()
     
@@ -148,14 +249,17 @@ class ProjectValidator:
         
         url = url.strip()
         
-        # Add https:// if missing
-        if url and not url.startswith(('http://', 'https://')):
-            if url.startswith('github.com'):
-                url = 'https://' + url
+        # Add https:// if missing; a github.com prefix rules out a scheme
+        if url.startswith('github.com'):
+            url = 'https://' + url
         
         return url
 
 
+# The validator holds no state, so one instance serves every submission
+_VALIDATOR = ProjectValidator()
+
+
 def validate_project_data(data: dict) -> Tuple[bool, List[str], dict]:
     """
     Validate and clean project submission data.
@@ -166,25 +270,35 @@ def validate_project_data(data: dict) -> Tuple[bool, List[str], dict]:
     Returns:
         Tuple of (is_valid, errors, cleaned_data)
     """
-    validator = ProjectValidator()
-    
-    # Clean data
-    cleaned = {}
-    for key, value in data.items():
-        if key in ["github_link", "demo_link"]:
-            cleaned[key] = validator.clean_url(str(value) if value else "")
-        elif key == "team_size":
-            try:
-                cleaned[key] = int(value) if value else None
-            except (ValueError, TypeError):
-                cleaned[key] = None
-        else:
-            cleaned[key] = validator.clean_text(str(value) if value else "")
-    
-    # Validate
-    is_valid, errors = validator.validate_all(cleaned)
-    
-    return is_valid, errors, cleaned
+    return _VALIDATOR.clean_and_validate(data)
+
+
+# Form help text shown under each field
+_HELP_TEXTS = {
+    "project_title": "A clear, memorable name for your project",
+    "team_size": "Number of team members (1-10)",
+    "problem_statement": "What problem does your project solve? Be specific about who faces this problem and why it matters.",
+    "solution_description": "How does your project solve the problem? Describe your approach, architecture, and key features.",
+    "tech_stack": "List the technologies used (e.g., React, Node.js, MongoDB, TensorFlow)",
+    "innovation_description": "What makes your solution unique? How is it different from existing solutions?",
+    "github_link": "Link to your GitHub repository (e.g., https://github.com/username/project)",
+    "demo_link": "Optional link to a live demo or video",
+    "target_users": "Who would use this? Describe your target audience and industry.",
+    "future_scope": "What are your plans for scaling and future development?"
+}
+
+# Example input shown inside each empty field
+_PLACEHOLDERS = {
+    "project_title": "e.g., SmartPark - AI Parking Management",
+    "problem_statement": "Describe the problem in detail...",
+    "solution_description": "Explain how your project solves this problem...",
+    "tech_stack": "e.g., Python, FastAPI, PostgreSQL, React, Docker",
+    "innovation_description": "What's new or different about your approach?",
+    "github_link": "https://github.com/username/project-name",
+    "demo_link": "https://your-demo-link.com (optional)",
+    "target_users": "Who will use this product?",
+    "future_scope": "How will this project grow?"
+}
 
 
 def get_field_help_text(field: str) -> str:
@@ -197,20 +311,7 @@ def get_field_help_text(field: str) -> str:
     Returns:
         Help text string
     """
-    help_texts = {
-        "project_title": "A clear, memorable name for your project",
-        "team_size": "Number of team members (1-10)",
-        "problem_statement": "What problem does your project solve? Be specific about who faces this problem and why it matters.",
-        "solution_description": "How does your project solve the problem? Describe your approach, architecture, and key features.",
-        "tech_stack": "List the technologies used (e.g., React, Node.js, MongoDB, TensorFlow)",
-        "innovation_description": "What makes your solution unique? How is it different from existing solutions?",
-        "github_link": "Link to your GitHub repository (e.g., https://github.com/username/project)",
-        "demo_link": "Optional link to a live demo or video",
-        "target_users": "Who would use this? Describe your target audience and industry.",
-        "future_scope": "What are your plans for scaling and future development?"
-    }
-    
-    return help_texts.get(field, "")
+    return _HELP_TEXTS.get(field, "")
 
 
 def get_field_placeholder(field: str) -> str:
@@ -223,16 +324,4 @@ def get_field_placeholder(field: str) -> str:
     Returns:
         Placeholder text
     """
-    placeholders = {
-        "project_title": "e.g., SmartPark - AI Parking Management",
-        "problem_statement": "Describe the problem in detail...",
-        "solution_description": "Explain how your project solves this problem...",
-        "tech_stack": "e.g., Python, FastAPI, PostgreSQL, React, Docker",
-        "innovation_description": "What's new or different about your approach?",
-        "github_link": "https://github.com/username/project-name",
-        "demo_link": "https://your-demo-link.com (optional)",
-        "target_users": "Who will use this product?",
-        "future_scope": "How will this project grow?"
-    }
-    
-    return placeholders.get(field, "")
+    return _PLACEHOLDERS.get(field, "")